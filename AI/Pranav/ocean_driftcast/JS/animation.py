@@ -4,16 +4,125 @@ Synthetic demo for presentation, not scientific output.
 Animation export system for creating looping MP4 and GIF visualizations.
 """
 
+import multiprocessing
 import numpy as np
 import os
-from typing import List, Dict, Tuple, Optional
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Dict, Tuple, Optional, Callable
 import matplotlib.pyplot as plt
 from PIL import Image
-import io
+from tqdm import tqdm
 
 from physics import OceanPhysics
 from particles import ParticleSystem, create_particle_system_from_city
-from visualization import OceanDriftVisualizer
+from visualization import OceanDriftVisualizer, snapshot_frame
+
+
+def get_ffmpeg_exe() -> str:
+    """
+    Locate an ffmpeg binary, preferring the one bundled with imageio-ffmpeg.
+
+    Returns:
+        Path to the ffmpeg executable
+    """
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except ImportError:
+        return 'ffmpeg'
+
+
+class FFmpegPipeWriter:
+    """
+    Stream raw RGB frames straight into an ffmpeg subprocess via stdin.
+    Frames are encoded as they arrive, so nothing is buffered in Python.
+    """
+
+    def __init__(self, output_path: str, width: int, height: int, fps: int,
+                 output_args: List[str]):
+        """
+        Start the ffmpeg process.
+
+        Args:
+            output_path: Output file path
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second
+            output_args: ffmpeg arguments placed between the input and output path
+        """
+        self.output_path = output_path
+        self.width = width
+        self.height = height
+        self.n_frames = 0
+
+        cmd = [
+            get_ffmpeg_exe(), '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-',
+            *output_args,
+            output_path
+        ]
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=1 << 20)
+
+    def write(self, frame: np.ndarray):
+        """
+        Write one (height, width, 3) uint8 frame.
+
+        Args:
+            frame: RGB frame
+        """
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if frame.shape != (self.height, self.width, 3):
+            raise ValueError(f"Frame shape {frame.shape} does not match "
+                             f"writer size {(self.height, self.width, 3)}")
+
+        self.proc.stdin.write(memoryview(frame).cast('B'))
+        self.n_frames += 1
+
+    def close(self):
+        """
+        Flush stdin and wait for ffmpeg to finish encoding.
+        """
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.output_path}")
+
+
+# Per-process state for ProcessPoolExecutor render workers
+_worker_state: Dict = {}
+
+
+def _init_render_worker(city_name: str, figsize: Tuple[float, float], dpi: int):
+    """
+    Initialize a render worker process with its own visualizer.
+
+    Args:
+        city_name: City name for info card
+        figsize: Figure size in inches
+        dpi: Resolution
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+    _worker_state['city_name'] = city_name
+    _worker_state['visualizer'] = OceanDriftVisualizer(figsize=figsize, dpi=dpi)
+
+
+def _render_snapshot_worker(snapshot: Dict) -> np.ndarray:
+    """
+    Render one frame snapshot in a worker process.
+
+    Args:
+        snapshot: Frame state from snapshot_frame
+
+    Returns:
+        (height, width, 3) uint8 RGB array
+    """
+    fig = _worker_state['visualizer'].draw_snapshot(snapshot, _worker_state['city_name'], blit=True)
+    return AnimationExporter.canvas_to_rgb(fig, draw=False)
 
 
 class AnimationExporter:
@@ -32,71 +141,173 @@ class AnimationExporter:
         os.makedirs(output_dir, exist_ok=True)
 
     def create_chapter(self, city_data: Dict, n_particles: int, n_steps: int,
-                      fps: int = 30, quality: str = 'high') -> Tuple[ParticleSystem, List[Image.Image]]:
+                      on_frame: Callable[[np.ndarray], None], fps: int = 30,
+                      quality: str = 'high', workers: Optional[int] = None,
+                      dpi: Optional[int] = None,
+                      physics: Optional[OceanPhysics] = None) -> ParticleSystem:
         """
         Create a single animation chapter for a city.
 
+        Frames are rendered from the simulation callback as each sampled step
+        is reached, so every frame shows the state (and metrics) at its own
+        step and rendering overlaps with the simulation.
+
         Args:
             city_data: City dictionary from seeds.json
             n_particles: Number of particles
             n_steps: Number of simulation steps
+            on_frame: Called in order with each (height, width, 3) uint8 RGB frame
             fps: Frames per second
             quality: 'low', 'medium', or 'high'
+            workers: Render processes (None = all CPUs, 1 = render in this process)
+            dpi: Render resolution (default: 100 for 'high' quality, else 72)
+            physics: Shared OceanPhysics instance (created with seed 42 if None)
 
         Returns:
-            ParticleSystem and list of PIL Images
+            Simulated ParticleSystem
         """
         print(f"Creating chapter for {city_data['city']}...")
 
         # Create physics and particle system
-        physics = OceanPhysics(seed=42)
+        if physics is None:
+            physics = OceanPhysics(seed=42)
         particles = create_particle_system_from_city(physics, city_data, n_particles)
 
-        # Run simulation
-        print(f"  Simulating {n_steps} steps...")
-        particles.simulate(n_steps)
+        city_name = city_data['city']
+        figsize = (20, 12)
+        if dpi is None:
+            dpi = self.get_dpi(quality)
+        traj_subsample = 5 if quality == 'high' else 10
+        frame_steps = self.get_frame_steps(n_steps, fps)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(frame_steps))
+
+        pool = None
+        visualizer = None
+        pending = deque()
+        n_frames = 0
+
+        if workers > 1:
+            # Snapshots are independent, so render them on all cores; each
+            # worker keeps its own figure. Workers are spawned, not forked, so
+            # they never inherit the parent's thread state (a fork of a
+            # threaded parent can hang it at exit).
+            print(f"  Simulating {n_steps} steps, rendering frames ({workers} processes)...")
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_render_worker,
+                initargs=(city_name, figsize, dpi)
+            )
+        else:
+            print(f"  Simulating {n_steps} steps, rendering frames...")
+            visualizer = OceanDriftVisualizer(figsize=figsize, dpi=dpi)
+
+        # One throttled progress bar instead of a print per frame
+        progress = tqdm(total=len(frame_steps), desc="    Frames", unit="frame",
+                        mininterval=0.5, leave=False)
+
+        def emit(frame: np.ndarray):
+            on_frame(frame)
+            progress.update(1)
+
+        def render(step: int):
+            nonlocal n_frames
+            snapshot = snapshot_frame(particles, step, traj_subsample=traj_subsample)
+            n_frames += 1
+
+            if pool is None:
+                # Read pixels straight from the Agg canvas (no PNG encode/decode)
+                fig = visualizer.draw_snapshot(snapshot, city_name, blit=True)
+                emit(self.canvas_to_rgb(fig, draw=False))
+                return
+
+            pending.append(pool.submit(_render_snapshot_worker, snapshot))
+            # Bound in-flight frames so the simulation can't run far ahead
+            while len(pending) > 2 * workers:
+                emit(pending.popleft().result())
+
+        def maybe_render(_i: int, ps: ParticleSystem):
+            # The callback's loop index restarts at 0 on every simulate() call;
+            # ps.step_count is the absolute history index just written
+            if ps.step_count in frame_steps:
+                render(ps.step_count)
+
+        try:
+            if 0 in frame_steps:
+                render(0)
+
+            particles.simulate(n_steps, callback=maybe_render)
 
-        # Generate frames
-        print(f"  Rendering frames...")
-        frames = []
-        visualizer = OceanDriftVisualizer(figsize=(20, 12), dpi=100 if quality == 'high' else 72)
+            while pending:
+                emit(pending.popleft().result())
+        finally:
+            progress.close()
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            else:
+                visualizer.close()
 
+        print(f"  Generated {n_frames} frames")
+
+        return particles
+
+    @staticmethod
+    def get_dpi(quality: str) -> int:
+        """
+        Render resolution for a quality level.
+
+        Args:
+            quality: 'low', 'medium', or 'high'
+
+        Returns:
+            Dots per inch
+        """
+        return 100 if quality == 'high' else 72
+
+    @staticmethod
+    def get_frame_steps(n_steps: int, fps: int) -> range:
+        """
+        Simulation steps that become animation frames.
+
+        Args:
+            n_steps: Number of simulation steps
+            fps: Frames per second
+
+        Returns:
+            Range of step indices
+        """
         # Determine frame sampling based on FPS and duration
         total_frames = fps * 60  # 60 seconds per chapter minimum
         step_interval = max(1, n_steps // total_frames)
 
-        for i in range(0, n_steps, step_interval):
-            if i % 20 == 0:
-                print(f"    Frame {i}/{n_steps}")
-
-            # Render frame
-            fig = visualizer.render_frame(
-                particles,
-                city_data['city'],
-                i,
-                show_trajectories=True,
-                show_particles=True,
-                traj_subsample=5 if quality == 'high' else 10
-            )
-
-            # Convert to PIL Image
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=100 if quality == 'high' else 72,
-                       facecolor='#0a1e2e', bbox_inches='tight')
-            buf.seek(0)
-            img = Image.open(buf).copy()
-            frames.append(img)
-            buf.close()
+        return range(0, n_steps, step_interval)
 
-            visualizer.close()
+    @staticmethod
+    def canvas_to_rgb(fig: plt.Figure, draw: bool = True) -> np.ndarray:
+        """
+        Draw a figure and copy its Agg buffer out as an RGB array.
 
-        print(f"  Generated {len(frames)} frames")
+        Args:
+            fig: Matplotlib figure on an Agg canvas
+            draw: Whether to draw first (False when the canvas was just blitted)
 
-        return particles, frames
+        Returns:
+            (height, width, 3) uint8 array
+        """
+        if draw:
+            fig.canvas.draw()
+        return np.ascontiguousarray(np.asarray(fig.canvas.buffer_rgba())[..., :3])
 
     def create_multi_chapter_animation(self, chapters: List[Dict], output_name: str = "drift_demo",
                                       n_particles: int = 5000, chapter_duration_weeks: int = 300,
-                                      fps: int = 30, quality: str = 'high'):
+                                      fps: int = 30, quality: str = 'high',
+                                      workers: Optional[int] = None,
+                                      formats: Tuple[str, ...] = ('mp4', 'gif'),
+                                      physics: Optional[OceanPhysics] = None,
+                                      codec_preset: str = 'ultrafast'):
         """
         Create multi-chapter looping animation.
 
@@ -107,71 +318,204 @@ class AnimationExporter:
             chapter_duration_weeks: Simulation weeks per chapter
             fps: Frames per second
             quality: 'low', 'medium', or 'high'
+            workers: Render processes per chapter (None = all CPUs)
+            formats: Outputs to write, any of 'mp4' and 'gif'
+            physics: OceanPhysics shared by all chapters (created with seed 42 if None)
+            codec_preset: x264 preset for the MP4
         """
-        all_frames = []
         all_metrics = []
 
-        for chapter_data in chapters:
-            particles, frames = self.create_chapter(
-                chapter_data,
-                n_particles=n_particles,
-                n_steps=chapter_duration_weeks,
-                fps=fps,
-                quality=quality
-            )
-
-            all_frames.extend(frames)
-
-            # Collect metrics
-            metrics = particles.get_metrics()
-            metrics['city'] = chapter_data['city']
-            all_metrics.append(metrics)
-
-        # Save frames as MP4 using imageio
-        print("\nExporting MP4...")
-        self.save_mp4(all_frames, f"{output_name}.mp4", fps=fps)
-
-        # Save as GIF
-        print("Exporting GIF...")
-        self.save_gif(all_frames, f"{output_name}.gif", fps=fps // 2, optimize=True)
+        # One physics instance for every chapter, like batch mode in main.py
+        if physics is None:
+            physics = OceanPhysics(seed=42)
+
+        # The GIF is half resolution. With an MP4 we render once at full size
+        # and let ffmpeg downscale; for a GIF alone, render at half dpi rather
+        # than producing pixels only to throw them away.
+        render_dpi = self.get_dpi(quality)
+        gif_scale = 0.5
+        if 'mp4' not in formats:
+            render_dpi //= 2
+            gif_scale = 1.0
+
+        # Frames are streamed into the MP4 and GIF encoders as they are
+        # rendered; nothing is kept in memory. Snapshots are read back from
+        # the encoded video afterwards.
+        frames_per_chapter = len(self.get_frame_steps(chapter_duration_weeks, fps))
+        total_frames = frames_per_chapter * len(chapters)
+        gif_step = max(1, total_frames // 300)
+
+        writer = None
+        gif_writer = None
+        frame_index = 0
+
+        def write_frame(frame: np.ndarray):
+            nonlocal writer, gif_writer, frame_index
+
+            height, width = frame.shape[:2]
+            if frame_index == 0:
+                if 'mp4' in formats:
+                    writer = self.open_mp4_writer(f"{output_name}.mp4", width, height, fps=fps,
+                                                  codec_preset=codec_preset)
+                if 'gif' in formats:
+                    gif_writer = self.open_gif_writer(f"{output_name}.gif", width, height,
+                                                      fps=fps // 2, scale=gif_scale)
+
+            if writer is not None:
+                writer.write(frame)
+            if gif_writer is not None and frame_index % gif_step == 0:
+                gif_writer.write(frame)
+
+            frame_index += 1
+
+        print(f"\nExporting {' and '.join(f.upper() for f in formats)} (streaming)...")
+        try:
+            for chapter_data in chapters:
+                particles = self.create_chapter(
+                    chapter_data,
+                    n_particles=n_particles,
+                    n_steps=chapter_duration_weeks,
+                    on_frame=write_frame,
+                    fps=fps,
+                    quality=quality,
+                    workers=workers,
+                    dpi=render_dpi,
+                    physics=physics
+                )
+
+                # Collect metrics
+                metrics = particles.get_metrics()
+                metrics['city'] = chapter_data['city']
+                all_metrics.append(metrics)
+        finally:
+            for w in (writer, gif_writer):
+                if w is not None:
+                    w.close()
+
+        for w in (writer, gif_writer):
+            if w is not None:
+                print(f"  Saved: {w.output_path}")
 
         # Save metrics
         print("Saving metrics...")
         self.save_metrics(all_metrics, f"{output_name}_metrics.json")
 
-        # Save sample snapshots
-        print("Saving snapshots...")
-        self.save_snapshots(all_frames, output_name, n_snapshots=10)
+        # Save sample snapshots, from the MP4 if there is one
+        video = writer if writer is not None else gif_writer
+        if video is not None:
+            print("Saving snapshots...")
+            self.save_snapshots(os.path.basename(video.output_path), output_name,
+                                n_frames=video.n_frames, n_snapshots=10)
 
         print(f"\nAnimation export complete!")
-        print(f"  Total frames: {len(all_frames)}")
-        print(f"  Duration: {len(all_frames)/fps:.1f} seconds")
+        print(f"  Total frames: {frame_index}")
+        print(f"  Duration: {frame_index/fps:.1f} seconds")
         print(f"  Output directory: {self.output_dir}")
 
-    def save_mp4(self, frames: List[Image.Image], filename: str, fps: int = 30):
+    def open_mp4_writer(self, filename: str, width: int, height: int, fps: int = 30,
+                        codec_preset: str = 'ultrafast') -> Optional[FFmpegPipeWriter]:
         """
-        Save frames as MP4 video.
+        Open a streaming H.264 MP4 writer.
+
+        The demo does not need archival quality, so the default 'ultrafast'
+        x264 preset keeps encoding far cheaper than rendering.
 
         Args:
-            frames: List of PIL Images
             filename: Output filename
+            width: Frame width in pixels
+            height: Frame height in pixels
             fps: Frames per second
+            codec_preset: x264 preset ('ultrafast' ... 'veryslow')
+
+        Returns:
+            FFmpegPipeWriter, or None if ffmpeg is not available
         """
+        output_path = os.path.join(self.output_dir, filename)
+
         try:
-            import imageio
-            output_path = os.path.join(self.output_dir, filename)
+            return FFmpegPipeWriter(
+                output_path, width, height, fps,
+                output_args=[
+                    # yuv420p needs even dimensions
+                    '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                    '-c:v', 'libx264', '-preset', codec_preset, '-crf', '23',
+                    '-pix_fmt', 'yuv420p', '-threads', '0'
+                ]
+            )
+        except FileNotFoundError:
+            print("  Warning: ffmpeg not available, skipping MP4 export")
+            print("  Install with: pip install imageio[ffmpeg]")
+            return None
 
-            # Convert PIL images to numpy arrays
-            frame_arrays = [np.array(frame) for frame in frames]
+    def open_gif_writer(self, filename: str, width: int, height: int,
+                        fps: int = 15, scale: float = 0.5) -> Optional[FFmpegPipeWriter]:
+        """
+        Open a streaming GIF writer.
 
-            # Write video
-            imageio.mimsave(output_path, frame_arrays, fps=fps, codec='libx264', quality=8)
-            print(f"  Saved: {output_path}")
-        except ImportError:
-            print("  Warning: imageio not available, skipping MP4 export")
+        ffmpeg builds one global palette from all frames (palettegen) and
+        applies it with ordered dithering (paletteuse), which is smaller and
+        bands less than PIL's per-frame quantization.
+
+        Args:
+            filename: Output filename
+            width: Input frame width in pixels
+            height: Input frame height in pixels
+            fps: Frames per second
+            scale: Output size relative to the input frames
+
+        Returns:
+            FFmpegPipeWriter, or None if ffmpeg is not available
+        """
+        output_path = os.path.join(self.output_dir, filename)
+
+        resize = f'scale=iw*{scale}:ih*{scale}:flags=lanczos,' if scale != 1.0 else ''
+
+        try:
+            return FFmpegPipeWriter(
+                output_path, width, height, fps,
+                output_args=[
+                    '-vf', f'{resize}split[a][b];'
+                           '[a]palettegen=stats_mode=diff[p];'
+                           '[b][p]paletteuse=dither=bayer:bayer_scale=5',
+                    '-loop', '0'
+                ]
+            )
+        except FileNotFoundError:
+            print("  Warning: ffmpeg not available, skipping GIF export")
             print("  Install with: pip install imageio[ffmpeg]")
+            return None
 
-    def save_gif(self, frames: List[Image.Image], filename: str, fps: int = 15, optimize: bool = True):
+    def save_mp4(self, frames: Iterable[Image.Image], filename: str, fps: int = 30,
+                 codec_preset: str = 'ultrafast'):
+        """
+        Save frames as MP4 video.
+
+        Frames are encoded one at a time, so a generator can feed this without
+        the whole sequence ever being held in memory.
+
+        Args:
+            frames: PIL Images (any iterable, e.g. a generator)
+            filename: Output filename
+            fps: Frames per second
+            codec_preset: x264 preset ('ultrafast' ... 'veryslow')
+        """
+        writer = None
+        try:
+            for frame in frames:
+                if writer is None:
+                    writer = self.open_mp4_writer(filename, frame.width, frame.height, fps=fps,
+                                                  codec_preset=codec_preset)
+                    if writer is None:
+                        return
+                writer.write(np.asarray(frame.convert('RGB')))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is not None:
+            print(f"  Saved: {writer.output_path}")
+
+    def save_gif(self, frames: List[Image.Image], filename: str, fps: int = 15):
         """
         Save frames as animated GIF.
 
@@ -179,55 +523,65 @@ class AnimationExporter:
             frames: List of PIL Images
             filename: Output filename
             fps: Frames per second
-            optimize: Whether to optimize GIF size
         """
-        output_path = os.path.join(self.output_dir, filename)
-
         # Downsample frames for GIF to reduce size
         if len(frames) > 300:
             step = len(frames) // 300
             frames = frames[::step]
 
-        # Resize frames for smaller GIF
-        resized_frames = []
-        for frame in frames:
-            # Resize to 50% for GIF
-            new_size = (frame.width // 2, frame.height // 2)
-            resized = frame.resize(new_size, Image.Resampling.LANCZOS)
-            resized_frames.append(resized)
-
-        # Save
-        duration = int(1000 / fps)  # milliseconds per frame
-        resized_frames[0].save(
-            output_path,
-            save_all=True,
-            append_images=resized_frames[1:],
-            duration=duration,
-            loop=0,
-            optimize=optimize
-        )
-        print(f"  Saved: {output_path}")
+        if not frames:
+            return
 
-    def save_snapshots(self, frames: List[Image.Image], base_name: str, n_snapshots: int = 10):
+        # ffmpeg halves the resolution and quantizes with a global palette
+        writer = self.open_gif_writer(filename, frames[0].width, frames[0].height, fps=fps)
+        if writer is None:
+            return
+
+        try:
+            for frame in frames:
+                writer.write(np.asarray(frame.convert('RGB')))
+        finally:
+            writer.close()
+
+        print(f"  Saved: {writer.output_path}")
+
+    def save_snapshots(self, video_filename: str, base_name: str, n_frames: int,
+                       n_snapshots: int = 10):
         """
-        Save sample snapshots from animation.
+        Save sample snapshots by extracting frames from an encoded video.
 
         Args:
-            frames: List of PIL Images
+            video_filename: MP4 or GIF in the output directory
             base_name: Base name for files
+            n_frames: Number of frames in the video
             n_snapshots: Number of snapshots to save
         """
         snapshot_dir = os.path.join(self.output_dir, "snapshots")
         os.makedirs(snapshot_dir, exist_ok=True)
 
-        indices = np.linspace(0, len(frames) - 1, n_snapshots, dtype=int)
-
-        for i, idx in enumerate(indices):
-            filename = f"{base_name}_snapshot_{i:03d}.png"
-            output_path = os.path.join(snapshot_dir, filename)
-            frames[idx].save(output_path)
+        indices = np.unique(np.linspace(0, n_frames - 1, n_snapshots, dtype=int))
+
+        # ffmpeg decodes once and keeps only the selected frame numbers.
+        # -vsync rather than its replacement -fps_mode (ffmpeg 5.1+), so the
+        # older system ffmpeg used without imageio-ffmpeg still accepts it.
+        select = '+'.join(f'eq(n\\,{k})' for k in indices)
+        cmd = [
+            get_ffmpeg_exe(), '-y', '-loglevel', 'error',
+            '-i', os.path.join(self.output_dir, video_filename),
+            '-vf', f"select='{select}'", '-vsync', 'passthrough',
+            # Snapshots are transient: favor fast zlib over small files, and
+            # let the PNG encoder compress frames on all cores
+            '-compression_level', '1', '-threads', '0',
+            '-start_number', '0',
+            os.path.join(snapshot_dir, f"{base_name}_snapshot_%03d.png")
+        ]
+        try:
+            subprocess.run(cmd, check=True)
+        except (FileNotFoundError, subprocess.CalledProcessError) as e:
+            print(f"  Warning: could not extract snapshots: {e}")
+            return
 
-        print(f"  Saved {n_snapshots} snapshots to {snapshot_dir}")
+        print(f"  Saved {len(indices)} snapshots to {snapshot_dir}")
 
     def save_metrics(self, metrics: List[Dict], filename: str):
         """
@@ -247,19 +601,24 @@ class AnimationExporter:
         print(f"  Saved: {output_path}")
 
 
-def create_demo_animation(seeds_file: str = "seeds.json", output_dir: str = "outputs"):
+def create_demo_animation(seeds_file: str = "seeds.json", output_dir: str = "outputs",
+                          seeds: Optional[List[Dict]] = None,
+                          physics: Optional[OceanPhysics] = None):
     """
     Create the full demo animation with 3 chapters.
 
     Args:
         seeds_file: Path to seeds.json
         output_dir: Output directory
+        seeds: Already-parsed seeds.json contents (seeds_file is read if None)
+        physics: OceanPhysics shared by all chapters (created with seed 42 if None)
     """
     import json
 
     # Load seeds
-    with open(seeds_file, 'r') as f:
-        seeds = json.load(f)
+    if seeds is None:
+        with open(seeds_file, 'r') as f:
+            seeds = json.load(f)
 
     # Find cities for the 3 chapters
     cities_dict = {city['city']: city for city in seeds}
@@ -286,7 +645,8 @@ def create_demo_animation(seeds_file: str = "seeds.json", output_dir: str = "out
         n_particles=3000,  # Reduced for performance
         chapter_duration_weeks=300,  # ~6 years per chapter
         fps=30,
-        quality='high'
+        quality='high',
+        physics=physics
     )
 
 
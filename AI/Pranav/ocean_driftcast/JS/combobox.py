@@ -7,6 +7,7 @@ Custom combobox widget for Matplotlib with dropdown, type-ahead, and keyboard na
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.widgets import TextBox
+from collections import defaultdict
 from difflib import get_close_matches
 from typing import List, Callable, Optional
 
@@ -29,8 +30,9 @@ class ComboBox:
             on_select: Callback function when option is selected
             initial_text: Initial text in textbox
         """
-        self.all_options = sorted(options)
-        self.filtered_options = self.all_options.copy()
+        self.all_options = tuple(sorted(options))
+        self.filtered_options = self.all_options
+        self._build_index()
         self.on_select = on_select
         self.selected_index = 0
         self.is_dropdown_open = False
@@ -88,12 +90,42 @@ class ComboBox:
         self.dropdown_ax = None
         self.dropdown_items = []
         self.dropdown_patches = []
+        self._dropdown_shown = None  # (options, selected) last drawn
 
         # Keyboard handler
         self.key_conn = None
 
+        # Debounced fuzzy matching (timer created on first use)
+        self.fuzzy_debounce_ms = 150
+        self._fuzzy_timer = None
+        self._pending_fuzzy_text = None
+
+    def _build_index(self):
+        """Cache lowercase options and index them by every 2-character substring."""
+        self._all_options_lower = [opt.lower() for opt in self.all_options]
+
+        self._bigram_index = defaultdict(list)
+        for i, opt_lower in enumerate(self._all_options_lower):
+            for bigram in {opt_lower[j:j + 2] for j in range(len(opt_lower) - 1)}:
+                self._bigram_index[bigram].append(i)
+
+    def _substring_matches(self, text_lower: str) -> List[str]:
+        """Options containing text_lower, in sorted order."""
+        if len(text_lower) < 2:
+            return [opt for opt, opt_lower in zip(self.all_options, self._all_options_lower)
+                    if text_lower in opt_lower]
+
+        # Any match must contain the query's first bigram, so only the
+        # indexed shortlist needs a full substring test
+        candidates = self._bigram_index.get(text_lower[:2], [])
+        return [self.all_options[i] for i in candidates
+                if text_lower in self._all_options_lower[i]]
+
     def _on_textbox_submit(self, text):
         """Handle Enter key in textbox."""
+        # Don't let the debounce delay change what Enter selects
+        self._apply_fuzzy()
+
         # Select current filtered option or first match
         if self.filtered_options:
             if self.is_dropdown_open and 0 <= self.selected_index < len(self.filtered_options):
@@ -109,24 +141,26 @@ class ComboBox:
 
     def _on_text_change(self, text):
         """Handle text changes for type-ahead filtering."""
+        # Any fuzzy pass queued for earlier text is now stale
+        self._pending_fuzzy_text = None
+        if self._fuzzy_timer is not None:
+            self._fuzzy_timer.stop()
+
         if not text.strip():
-            self.filtered_options = self.all_options.copy()
+            self.filtered_options = self.all_options
         else:
-            # Fuzzy matching
-            text_lower = text.lower()
-
-            # Exact matches first
-            exact = [opt for opt in self.all_options if text_lower in opt.lower()]
-
-            # Then fuzzy matches
-            fuzzy = get_close_matches(text, self.all_options, n=10, cutoff=0.4)
+            # Exact matches first (cheap, so filter synchronously)
+            exact = self._substring_matches(text.lower())
 
-            # Combine, removing duplicates
-            self.filtered_options = exact + [f for f in fuzzy if f not in exact]
+            # With no exact hits, keep the previous list until the fuzzy
+            # pass decides what to show, rather than flashing every option
+            if exact:
+                self.filtered_options = exact
 
-            # If nothing found, show all
-            if not self.filtered_options:
-                self.filtered_options = self.all_options.copy()
+            # Fuzzy matches are only needed if exact ones don't fill the list;
+            # debounce them so fast typing doesn't rerun difflib per keystroke
+            if len(exact) < 10:
+                self._schedule_fuzzy(text)
 
         # Reset selection
         self.selected_index = 0
@@ -135,6 +169,42 @@ class ComboBox:
         if self.is_dropdown_open:
             self._update_dropdown_list()
 
+    def _schedule_fuzzy(self, text):
+        """(Re)start the debounce timer for fuzzy matching of text."""
+        self._pending_fuzzy_text = text
+
+        if self._fuzzy_timer is None:
+            self._fuzzy_timer = self.textbox.ax.figure.canvas.new_timer(
+                interval=self.fuzzy_debounce_ms
+            )
+            self._fuzzy_timer.single_shot = True
+            self._fuzzy_timer.add_callback(self._apply_fuzzy)
+
+        self._fuzzy_timer.stop()
+        self._fuzzy_timer.start()
+
+    def _apply_fuzzy(self):
+        """Append fuzzy matches for the pending text once typing has paused."""
+        text = self._pending_fuzzy_text
+        if text is None:
+            return
+        self._pending_fuzzy_text = None
+
+        exact = self._substring_matches(text.lower())
+        fuzzy = get_close_matches(text, self.all_options, n=10, cutoff=0.4)
+
+        # Combine, removing duplicates
+        exact_set = set(exact)
+        combined = exact + [f for f in fuzzy if f not in exact_set]
+
+        # An empty list means nothing matches the text at all
+        self.filtered_options = combined
+        if self.selected_index >= len(combined):
+            self.selected_index = 0
+
+        if self.is_dropdown_open:
+            self._update_dropdown_list()
+
     def _on_dropdown_click(self, event):
         """Handle dropdown button click."""
         if event.inaxes == self.dropdown_btn_ax:
@@ -183,6 +253,28 @@ class ComboBox:
         )
         self.dropdown_ax.add_patch(border)
 
+        # Create the item rows once; _update_dropdown_list only restyles them
+        for i in range(10):
+            patch = mpatches.Rectangle(
+                (0, 0), 1, 1,
+                facecolor=self.bg_color,
+                edgecolor='none',
+                transform=self.dropdown_ax.transData,
+                visible=False
+            )
+            self.dropdown_ax.add_patch(patch)
+            self.dropdown_patches.append(patch)
+
+            text = self.dropdown_ax.text(
+                0.02, 0.5, '',
+                ha='left', va='center',
+                color=self.text_color,
+                fontsize=8,
+                transform=self.dropdown_ax.transData,
+                visible=False
+            )
+            self.dropdown_items.append(text)
+
         # Populate list
         self._update_dropdown_list()
 
@@ -199,20 +291,21 @@ class ComboBox:
         if not self.dropdown_ax:
             return
 
-        # Clear existing items
-        for patch in self.dropdown_patches:
-            patch.remove()
-        for text in self.dropdown_items:
-            text.remove()
-
-        self.dropdown_patches = []
-        self.dropdown_items = []
+        # Skip the redraw when neither the items nor the highlight changed
+        shown = (tuple(self.filtered_options[:10]), self.selected_index)
+        if shown == self._dropdown_shown:
+            return
+        self._dropdown_shown = shown
 
         # Show up to 10 items
         max_items = min(10, len(self.filtered_options))
 
-        for i in range(max_items):
-            option = self.filtered_options[i]
+        for i, (patch, text) in enumerate(zip(self.dropdown_patches, self.dropdown_items)):
+            if i >= max_items:
+                patch.set_visible(False)
+                text.set_visible(False)
+                continue
+
             y_pos = max_items - i - 1
 
             # Background patch
@@ -220,25 +313,15 @@ class ComboBox:
             bg_color = self.highlight_color if is_selected else self.bg_color
             fg_color = '#000000' if is_selected else self.text_color
 
-            patch = mpatches.Rectangle(
-                (0, y_pos), 1, 1,
-                facecolor=bg_color,
-                edgecolor='none',
-                transform=self.dropdown_ax.transData
-            )
-            self.dropdown_ax.add_patch(patch)
-            self.dropdown_patches.append(patch)
+            patch.set_y(y_pos)
+            patch.set_facecolor(bg_color)
+            patch.set_visible(True)
 
             # Text
-            text = self.dropdown_ax.text(
-                0.02, y_pos + 0.5,
-                option,
-                ha='left', va='center',
-                color=fg_color,
-                fontsize=8,
-                transform=self.dropdown_ax.transData
-            )
-            self.dropdown_items.append(text)
+            text.set_position((0.02, y_pos + 0.5))
+            text.set_text(self.filtered_options[i])
+            text.set_color(fg_color)
+            text.set_visible(True)
 
         self.dropdown_ax.figure.canvas.draw_idle()
 
@@ -255,6 +338,7 @@ class ComboBox:
 
         self.dropdown_items = []
         self.dropdown_patches = []
+        self._dropdown_shown = None
 
         if self.key_conn:
             self.textbox.ax.figure.canvas.mpl_disconnect(self.key_conn)
@@ -273,7 +357,7 @@ class ComboBox:
 
         if event.key == 'down':
             # Move down
-            self.selected_index = min(self.selected_index + 1, len(self.filtered_options) - 1)
+            self.selected_index = max(min(self.selected_index + 1, len(self.filtered_options) - 1), 0)
             self._update_dropdown_list()
 
         elif event.key == 'up':
@@ -283,6 +367,7 @@ class ComboBox:
 
         elif event.key == 'enter':
             # Select current item
+            self._apply_fuzzy()
             if self.filtered_options:
                 selected = self.filtered_options[self.selected_index]
                 self.textbox.set_val(selected)
@@ -314,8 +399,9 @@ class ComboBox:
 
     def set_options(self, options: List[str]):
         """Update the list of available options."""
-        self.all_options = sorted(options)
-        self.filtered_options = self.all_options.copy()
+        self.all_options = tuple(sorted(options))
+        self.filtered_options = self.all_options
+        self._build_index()
         self.selected_index = 0
 
         if self.is_dropdown_open:
@@ -9,7 +9,7 @@ Main entry point for interactive UI and batch simulation.
 import argparse
 import json
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 
 from physics import OceanPhysics
 from particles import create_particle_system_from_city
@@ -18,8 +18,22 @@ from ui import launch_interactive_ui
 from animation import create_demo_animation
 
 
+def load_seeds(seeds_file: str = 'seeds.json') -> List[Dict]:
+    """
+    Load city seed data.
+
+    Args:
+        seeds_file: Path to seeds.json
+
+    Returns:
+        List of city dictionaries
+    """
+    with open(seeds_file, 'r') as f:
+        return json.load(f)
+
+
 def single_city_demo(city_name: str, n_particles: int = 5000, n_steps: int = 1040,
-                     output_file: Optional[str] = None):
+                     output_file: Optional[str] = None, seeds: Optional[List[Dict]] = None):
     """
     Run simulation for a single city and display result.
 
@@ -28,14 +42,15 @@ def single_city_demo(city_name: str, n_particles: int = 5000, n_steps: int = 104
         n_particles: Number of particles
         n_steps: Simulation steps (weeks)
         output_file: Optional output image file
+        seeds: Already-loaded seeds (seeds.json is read if None)
     """
     print(f"\n{'='*60}")
     print(f"  OCEAN DRIFT DEMO - {city_name.upper()}")
     print(f"{'='*60}\n")
 
     # Load seeds
-    with open('seeds.json', 'r') as f:
-        seeds = json.load(f)
+    if seeds is None:
+        seeds = load_seeds()
 
     # Find city
     city_data = None
@@ -57,7 +72,11 @@ def single_city_demo(city_name: str, n_particles: int = 5000, n_steps: int = 104
     # Create physics and particles
     print("Initializing simulation...")
     physics = OceanPhysics(seed=42)
-    particles = create_particle_system_from_city(physics, city_data, n_particles)
+    try:
+        particles = create_particle_system_from_city(physics, city_data, n_particles)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
 
     # Run simulation
     print(f"Simulating {n_steps} weeks (~{n_steps/52:.1f} years) with {n_particles} particles...")
@@ -111,13 +130,15 @@ def single_city_demo(city_name: str, n_particles: int = 5000, n_steps: int = 104
     viz.close()
 
 
-def batch_all_cities(n_particles: int = 3000, n_steps: int = 1040):
+def batch_all_cities(n_particles: int = 3000, n_steps: int = 1040,
+                     seeds: Optional[List[Dict]] = None):
     """
     Run simulation for all cities and save metrics.
 
     Args:
         n_particles: Number of particles per city
         n_steps: Simulation steps
+        seeds: Already-loaded seeds (seeds.json is read if None)
     """
     import os
 
@@ -126,8 +147,8 @@ def batch_all_cities(n_particles: int = 3000, n_steps: int = 1040):
     print(f"{'='*60}\n")
 
     # Load seeds
-    with open('seeds.json', 'r') as f:
-        seeds = json.load(f)
+    if seeds is None:
+        seeds = load_seeds()
 
     print(f"Simulating {len(seeds)} cities...")
     print(f"Particles per city: {n_particles}")
@@ -146,8 +167,13 @@ def batch_all_cities(n_particles: int = 3000, n_steps: int = 1040):
     for i, city_data in enumerate(seeds):
         print(f"[{i+1}/{len(seeds)}] {city_data['city']}...")
 
-        # Create and simulate
-        particles = create_particle_system_from_city(physics, city_data, n_particles)
+        # Create and simulate; cities whose release area is all land in this
+        # model are reported and skipped
+        try:
+            particles = create_particle_system_from_city(physics, city_data, n_particles)
+        except ValueError as e:
+            print(f"  Skipped: {e}\n")
+            continue
         particles.simulate(n_steps)
 
         # Get metrics
@@ -256,11 +282,11 @@ Examples:
     # Mode selection
     if args.animate:
         # Create demo animation
-        create_demo_animation()
+        create_demo_animation(seeds=load_seeds())
 
     elif args.batch:
         # Batch mode
-        batch_all_cities(n_particles=args.particles, n_steps=n_steps)
+        batch_all_cities(n_particles=args.particles, n_steps=n_steps, seeds=load_seeds())
 
     elif args.city:
         # Single city mode
@@ -268,7 +294,8 @@ Examples:
             city_name=args.city,
             n_particles=args.particles,
             n_steps=n_steps,
-            output_file=args.output
+            output_file=args.output,
+            seeds=load_seeds()
         )
 
     else:
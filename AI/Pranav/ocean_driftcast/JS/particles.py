@@ -4,9 +4,110 @@ Synthetic demo for presentation, not scientific output.
 FIXED: Particle system with offshore spawning and proper beaching logic.
 """
 
+import contextlib
+import io
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from typing import Tuple, List, Dict, Optional
-from physics import OceanPhysics
+from typing import Tuple, Dict, Optional
+from physics import OceanPhysics, DEG_TO_RAD, DEG_TO_KM, PARALLEL_MIN_PARTICLES
+
+# Kernels are compiled once per argument dtype and cached on disk (cache=True),
+# so repeated runs and worker processes skip the compile. Particle counts stay
+# runtime values: baking them in would recompile for every run size without
+# speeding up these memory-bound loops.
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy versions below are used
+    njit = None
+
+# Trajectory history is stored as int16 fixed point, HISTORY_SCALE units per
+# degree (0.01 deg, about 1 km): plenty for drawing tracks, and half the bytes of
+# float32. Longitudes up to +-180 deg fit comfortably in int16.
+HISTORY_SCALE = 100.0
+
+# Extra spawn_offshore rounds (each asking for twice as many points) before a
+# release area is given up on as land
+SPAWN_RETRY_ROUNDS = 4
+
+
+def _encode_degrees(degrees: np.ndarray, out: np.ndarray):
+    """Round degrees into an int16 history row (out) at HISTORY_SCALE units per degree."""
+    scaled = np.multiply(degrees, HISTORY_SCALE, dtype=np.float32)
+    np.rint(scaled, out=scaled)
+    out[...] = scaled
+
+
+def _decode_degrees(stored: np.ndarray) -> np.ndarray:
+    """Convert int16 history values back to float32 degrees (a new array)."""
+    degrees = stored.astype(np.float32)
+    degrees /= np.float32(HISTORY_SCALE)
+    return degrees
+
+
+def _accumulate_distance(lat: np.ndarray, lon: np.ndarray, prev_lat: np.ndarray,
+                         prev_lon: np.ndarray, active: np.ndarray,
+                         total_distance: np.ndarray):
+    """
+    Add each active particle's step length (km) to total_distance in place.
+
+    Args:
+        lat, lon: Positions after the step (degrees)
+        prev_lat, prev_lon: Positions before the step (degrees)
+        active: Indices of particles still afloat after the step
+        total_distance: Per-particle distance accumulator (km)
+    """
+    if active.size:
+        dlat = lat[active] - prev_lat[active]
+        dlon = lon[active] - prev_lon[active]
+
+        # Convert to km using haversine approximation; the km-per-degree
+        # factor is applied once to the combined length, not per component
+        dlon *= np.cos(prev_lat[active] * DEG_TO_RAD)
+        total_distance[active] += DEG_TO_KM * np.hypot(dlat, dlon)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _accumulate_distance(lat, lon, prev_lat, prev_lon, active, total_distance):
+        # Same maths as the NumPy version, fused into one pass with no temporaries
+        for k in prange(active.shape[0]):
+            i = active[k]
+            dlat = lat[i] - prev_lat[i]
+            dlon = lon[i] - prev_lon[i]
+            dlon *= math.cos(prev_lat[i] * DEG_TO_RAD)
+            total_distance[i] += DEG_TO_KM * math.sqrt(dlat * dlat + dlon * dlon)
+
+
+def _metric_totals(total_distance: np.ndarray, is_beached: np.ndarray) -> Tuple[float, float, int]:
+    """
+    Sum and max of the travelled distances plus the number of beached particles.
+
+    Returns:
+        distance sum (km), distance max (km), beached count
+    """
+    return (float(total_distance.sum(dtype=np.float64)), float(total_distance.max()),
+            int(np.count_nonzero(is_beached)))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _metric_totals(total_distance, is_beached):
+        # All three reductions in a single pass over the particles
+        total = 0.0
+        longest = total_distance[0]
+        n_beached = 0
+        for i in range(total_distance.shape[0]):
+            d = total_distance[i]
+            total += d
+            if d > longest:
+                longest = d
+            if is_beached[i]:
+                n_beached += 1
+        return total, longest, n_beached
+
 
 class ParticleSystem:
     """
@@ -31,105 +132,333 @@ class ParticleSystem:
         self.release_lon = release_lon
         self.release_radius_km = release_radius_km
 
+        # Current and previous positions share one [slot, lat/lon, particle]
+        # buffer; step() integrates into the other slot and flips, so the old
+        # positions stay available without copying them. Single precision is
+        # ample for the demo and halves the memory traffic of every step.
+        self._pos = np.empty((2, 2, n_particles), dtype=np.float32)
+        self._cur = 0
+
         # FIXED: Use spawn_offshore to ensure particles start in ocean
         print(f"  Spawning {n_particles} particles offshore (radius={release_radius_km}km)...")
-        self.lat, self.lon = physics.spawn_offshore(release_lat, release_lon, n_particles, release_radius_km)
-
-        # Verify spawning worked
-        on_land = physics.is_on_land(self.lat, self.lon)
-        if np.any(on_land):
-            print(f"  WARNING: {np.sum(on_land)} particles spawned on land! Resampling...")
-            # Resample those on land
-            while np.any(on_land):
-                n_resample = np.sum(on_land)
-                new_lat, new_lon = physics.spawn_offshore(release_lat, release_lon, n_resample, release_radius_km)
-                self.lat[on_land] = new_lat[:n_resample]
-                self.lon[on_land] = new_lon[:n_resample]
-                on_land = physics.is_on_land(self.lat, self.lon)
+        lat, lon = physics.spawn_offshore(release_lat, release_lon, n_particles, release_radius_km)
+
+        # spawn_offshore already rejects land points, so its output only needs
+        # checking for a shortfall (it gives up after a fixed number of tries)
+        n_valid = len(lat)
+        self.lat[:n_valid] = lat
+        self.lon[:n_valid] = lon
+
+        if n_valid < n_particles:
+            print(f"  WARNING: only {n_valid} offshore positions found! Resampling...")
+            # Ask for the shortfall in larger batches, writing each one
+            # contiguously after the positions collected so far. The rounds
+            # are capped: a release area that is all land never fills up.
+            n_try = 2 * (n_particles - n_valid)
+            for _ in range(SPAWN_RETRY_ROUNDS):
+                lat, lon = physics.spawn_offshore(release_lat, release_lon, n_try, release_radius_km)
+                n_new = min(len(lat), n_particles - n_valid)
+                self.lat[n_valid:n_valid + n_new] = lat[:n_new]
+                self.lon[n_valid:n_valid + n_new] = lon[:n_new]
+                n_valid += n_new
+                if n_valid == n_particles:
+                    break
+                n_try *= 2
+            else:
+                raise ValueError(
+                    f"Only {n_valid}/{n_particles} ocean positions found within "
+                    f"{release_radius_km} km of ({release_lat}, {release_lon})"
+                )
 
         print(f"  [OK] All {n_particles} particles spawned in ocean")
 
+        self._init_state()
+
+    def _init_state(self, is_beached: Optional[np.ndarray] = None,
+                    total_distance: Optional[np.ndarray] = None, step_count: int = 0):
+        """
+        Set up beaching, history and metric state around the current positions.
+
+        Args:
+            is_beached: Starting beached flags (default: none beached)
+            total_distance: Starting distances in km (default: zeros)
+            step_count: Step the current positions belong to; history rows
+                before it are left unset (simulation shards only report new steps)
+        """
+        n_particles = self.n_particles
+
         # Particle state
         self.is_beached = np.zeros(n_particles, dtype=bool)
-
-        # Trajectory history
-        self.history_lat = [self.lat.copy()]
-        self.history_lon = [self.lon.copy()]
-        self.history_beached = [self.is_beached.copy()]
+        if is_beached is not None:
+            self.is_beached[:] = is_beached
+        self._active_idx = np.flatnonzero(~self.is_beached)  # rebuilt only when particles beach
+
+        # Trajectory history, preallocated as (steps + 1, n_particles) arrays.
+        # simulate() sizes them for the whole run; step() grows them if needed.
+        # Positions are stored in fixed point (see HISTORY_SCALE); the live
+        # state and the distance metrics stay in float32.
+        n_rows = step_count + 1
+        self._history_lat = np.empty((n_rows, n_particles), dtype=np.int16)
+        self._history_lon = np.empty((n_rows, n_particles), dtype=np.int16)
+        self._history_beached = np.empty((n_rows, (n_particles + 7) // 8), dtype=np.uint8)  # packed bits
+        _encode_degrees(self.lat, self._history_lat[step_count])
+        _encode_degrees(self.lon, self._history_lon[step_count])
+        self._history_beached[step_count] = np.packbits(self.is_beached)
 
         # Metrics
-        self.step_count = 0
-        self.total_distance = np.zeros(n_particles)  # km
+        self.step_count = step_count
+        self.total_distance = np.zeros(n_particles, dtype=np.float32)  # km
+        if total_distance is not None:
+            self.total_distance[:] = total_distance
+
+        # Float32 (lon, lat) render buffer, refreshed lazily by xy32
+        self._xy32 = np.empty((n_particles, 2), dtype=np.float32)
+        self._xy32_step = -1
+
+        # get_metrics() result, reused until the next step
+        self._metrics = None
+        self._metrics_step = -1
 
     def step(self):
         """
         Advance simulation by one time step.
         FIXED: Passes step_count to check_beaching.
         """
-        # Store previous positions for distance calculation
-        prev_lat = self.lat.copy()
-        prev_lon = self.lon.copy()
-
-        # RK4 integration
-        self.lat, self.lon = self.physics.rk4_step(self.lat, self.lon, self.is_beached)
+        # RK4 integration into the spare slot; the previous positions stay put
+        # in the old one for the distance calculation
+        prev = self._cur
+        self._cur ^= 1
+        self.physics.rk4_step(self._pos[prev, 0], self._pos[prev, 1], self.is_beached,
+                              out=(self.lat, self.lon), active_idx=self._active_idx)
+        prev_lat, prev_lon = self._pos[prev]
 
         # FIXED: Pass step_number to check_beaching
         self.is_beached = self.physics.check_beaching(self.lat, self.lon, self.is_beached, self.step_count)
 
-        # Calculate distance traveled
-        active = ~self.is_beached
-        if np.any(active):
-            dlat = self.lat[active] - prev_lat[active]
-            dlon = self.lon[active] - prev_lon[active]
-
-            # Convert to km using haversine approximation
-            lat_rad = prev_lat[active] * np.pi / 180
-            dx = dlon * np.cos(lat_rad) * 111.32  # km per degree longitude
-            dy = dlat * 111.32  # km per degree latitude
-            dist = np.sqrt(dx**2 + dy**2)
+        # Beaching is permanent, so the active set only changes when the count does
+        n_active = self.n_particles - np.count_nonzero(self.is_beached)
+        if n_active != self._active_idx.size:
+            self._active_idx = np.flatnonzero(~self.is_beached)
 
-            self.total_distance[active] += dist
+        # Calculate distance traveled
+        _accumulate_distance(self.lat, self.lon, prev_lat, prev_lon,
+                             self._active_idx, self.total_distance)
 
         # Store history
-        self.history_lat.append(self.lat.copy())
-        self.history_lon.append(self.lon.copy())
-        self.history_beached.append(self.is_beached.copy())
+        t = self.step_count + 1
+        self._reserve_history(t + 1)
+        _encode_degrees(self.lat, self._history_lat[t])
+        _encode_degrees(self.lon, self._history_lon[t])
+        self._history_beached[t] = np.packbits(self.is_beached)
 
         self.step_count += 1
 
-    def simulate(self, n_steps: int, callback: Optional[callable] = None):
+    def simulate(self, n_steps: int, callback: Optional[callable] = None,
+                 store_path: Optional[str] = None):
         """
         Run simulation for n_steps.
 
         Args:
             n_steps: Number of time steps
             callback: Optional callback function called after each step
+            store_path: Optional path prefix; if given, the history is kept in
+                memory-mapped .npy files ({store_path}_history_lat.npy etc.)
+                instead of RAM, for runs too long to hold in memory. Calling
+                again with the same store_path continues the run in chunks,
+                growing the files.
         """
+        self._reserve_history(self.step_count + n_steps + 1, store_path)
+
+        # The week loop stays in Python: each stage it calls is already one
+        # compiled or vectorised pass, and keeping the stages separate keeps
+        # the NumPy RNG stream, the coast KD-tree and the history writes
+        # identical with and without Numba.
         for i in range(n_steps):
             self.step()
 
             if callback is not None:
                 callback(i, self)
 
+    @property
+    def lat(self) -> np.ndarray:
+        """Current latitudes (a view into the position buffer)."""
+        return self._pos[self._cur, 0]
+
+    @lat.setter
+    def lat(self, value: np.ndarray):
+        self._pos[self._cur, 0] = value
+
+    @property
+    def lon(self) -> np.ndarray:
+        """Current longitudes (a view into the position buffer)."""
+        return self._pos[self._cur, 1]
+
+    @lon.setter
+    def lon(self, value: np.ndarray):
+        self._pos[self._cur, 1] = value
+
+    def _reserve_history(self, n_rows: int, store_path: Optional[str] = None):
+        """
+        Make sure the history arrays can hold at least n_rows time steps.
+
+        Args:
+            n_rows: Required number of rows (steps + 1)
+            store_path: Move the history into memory-mapped .npy files with
+                this path prefix (sized exactly to n_rows); the current store
+                is grown in place when it is too small
+        """
+        capacity = self._history_lat.shape[0]
+        current_store = getattr(self, '_history_store', None)
+
+        if capacity >= n_rows and store_path in (None, current_store):
+            return
+
+        if store_path is None:
+            # Grow geometrically so open-ended step() calls stay amortized O(1).
+            # (A full on-disk store also lands here and continues in RAM.)
+            capacity = max(n_rows, 2 * capacity)
+        else:
+            capacity = max(n_rows, self.step_count + 1)
+        self._history_store = store_path
+
+        n_used = self.step_count + 1
+        for name in ('_history_lat', '_history_lon', '_history_beached'):
+            old = getattr(self, name)
+            shape = (capacity,) + old.shape[1:]
+            if store_path is None:
+                new = np.empty(shape, dtype=old.dtype)
+                new[:n_used] = old[:n_used]
+                setattr(self, name, new)
+                continue
+
+            # Written to a temporary file and moved into place, so a store that
+            # is being grown is still readable while it is copied. The old
+            # mapping is released first (Windows can't replace a mapped file).
+            path = f"{store_path}{name}.npy"
+            new = np.lib.format.open_memmap(f"{path}.tmp", mode='w+', dtype=old.dtype, shape=shape)
+            new[:n_used] = old[:n_used]
+            new.flush()
+            del new, old
+            setattr(self, name, None)
+            os.replace(f"{path}.tmp", path)
+            setattr(self, name, np.load(path, mmap_mode='r+'))
+
+    @property
+    def history_lat(self) -> np.ndarray:
+        """Latitude history as a (steps + 1, n_particles) float32 array (decoded on access)."""
+        return _decode_degrees(self._history_lat[:self.step_count + 1])
+
+    @property
+    def history_lon(self) -> np.ndarray:
+        """Longitude history as a (steps + 1, n_particles) float32 array (decoded on access)."""
+        return _decode_degrees(self._history_lon[:self.step_count + 1])
+
+    def get_history(self, n_rows: Optional[int] = None,
+                    particle_subsample: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode part of the trajectory history.
+
+        Only the requested rows and particles are decoded, so this is cheaper
+        than slicing history_lat/history_lon.
+
+        Args:
+            n_rows: Number of leading history rows, i.e. steps + 1 (default: all)
+            particle_subsample: Keep every Nth particle
+
+        Returns:
+            lat, lon float32 arrays of shape (rows, particles)
+        """
+        stop = self.step_count + 1 if n_rows is None else min(n_rows, self.step_count + 1)
+        cols = slice(None, None, particle_subsample)
+        return (_decode_degrees(self._history_lat[:stop, cols]),
+                _decode_degrees(self._history_lon[:stop, cols]))
+
+    @property
+    def history_beached(self) -> np.ndarray:
+        """Beached-flag history as a (steps + 1, n_particles) bool array (unpacked on access)."""
+        packed = self._history_beached[:self.step_count + 1]
+        return np.unpackbits(packed, axis=1, count=self.n_particles).view(bool)
+
+    def simulate_parallel(self, n_steps: int, n_workers: Optional[int] = None):
+        """
+        Run simulation for n_steps, splitting the particles across processes.
+
+        Particles never interact, so each worker advances its own slice of
+        them and the histories are stitched back together afterwards. Each
+        slice gets its own random stream, so results differ from simulate()
+        with the same seed. There is no per-step callback; use simulate() when
+        frames are rendered during the run.
+
+        Args:
+            n_steps: Number of time steps
+            n_workers: Worker processes (default: one per CPU)
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = min(n_workers, self.n_particles)
+
+        if n_workers <= 1:
+            self.simulate(n_steps)
+            return
+
+        bounds = np.linspace(0, self.n_particles, n_workers + 1).astype(int)
+        shards = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+        seeds = self.physics.rng.integers(0, 2**31 - 1, size=n_workers)
+        start = self.step_count
+
+        # Spawned, not forked: forking after Numba's parallel kernels have
+        # started their thread pool (spawn_offshore already ran them) hangs
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = [
+                pool.submit(_simulate_shard, self.physics, self.lat[sl], self.lon[sl],
+                            self.is_beached[sl], self.total_distance[sl], start, n_steps, seed)
+                for sl, seed in zip(shards, seeds)
+            ]
+            results = [f.result() for f in futures]
+
+        self._reserve_history(start + n_steps + 1)
+        rows = slice(start + 1, start + n_steps + 1)
+        history_beached = np.empty((n_steps, self.n_particles), dtype=bool)
+
+        for sl, (lat, lon, is_beached, total_distance, h_lat, h_lon, h_beached) in zip(shards, results):
+            self.lat[sl] = lat
+            self.lon[sl] = lon
+            self.is_beached[sl] = is_beached
+            self.total_distance[sl] = total_distance
+            self._history_lat[rows, sl] = h_lat
+            self._history_lon[rows, sl] = h_lon
+            history_beached[:, sl] = h_beached
+
+        self._history_beached[rows] = np.packbits(history_beached, axis=1)
+        self._active_idx = np.flatnonzero(~self.is_beached)
+        self.step_count += n_steps
+
     def get_metrics(self) -> Dict:
         """
         Calculate summary metrics.
 
+        The UI and renderers ask for these several times per run; the values
+        only change when the simulation steps, so they are computed once per
+        step and a copy is returned.
+
         Returns:
             Dictionary with metrics
         """
-        n_beached = np.sum(self.is_beached)
+        if self._metrics_step == self.step_count:
+            return dict(self._metrics)
+
+        distance_sum, max_distance_km, n_beached = _metric_totals(self.total_distance, self.is_beached)
         n_ocean = self.n_particles - n_beached
 
         # Ocean reach probability (never beached during simulation)
         ocean_reach_prob = n_ocean / self.n_particles
 
-        # Distance statistics
+        # Distance statistics (np.median partitions rather than sorting)
         median_distance_km = np.median(self.total_distance)
-        mean_distance_km = np.mean(self.total_distance)
-        max_distance_km = np.max(self.total_distance)
+        mean_distance_km = distance_sum / self.n_particles
 
-        return {
+        self._metrics = {
             'n_particles': self.n_particles,
             'n_beached': int(n_beached),
             'n_ocean': int(n_ocean),
@@ -141,6 +470,8 @@ class ParticleSystem:
             'n_steps': self.step_count,
             'years': self.step_count / 52.0
         }
+        self._metrics_step = self.step_count
+        return dict(self._metrics)
 
     def get_probability_category(self) -> str:
         """
@@ -149,8 +480,8 @@ class ParticleSystem:
         Returns:
             Category string
         """
-        metrics = self.get_metrics()
-        prob = metrics['ocean_reach_prob']
+        # Only the beached count is needed, not the full distance statistics
+        prob = 1.0 - np.count_nonzero(self.is_beached) / self.n_particles
 
         if prob < 0.3:
             return "LOW"
@@ -159,7 +490,7 @@ class ParticleSystem:
         else:
             return "HIGH"
 
-    def get_trajectory_arrays(self, subsample: int = 1) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    def get_trajectory_arrays(self, subsample: int = 1) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get trajectory history as arrays.
 
@@ -167,47 +498,71 @@ class ParticleSystem:
             subsample: Sample every N time steps
 
         Returns:
-            List of lat arrays, List of lon arrays (one per particle)
+            lat, lon float32 arrays of shape (n_particles, n_samples); row i
+            is particle i's track (transposed views of freshly decoded arrays)
         """
-        trajectories_lat = []
-        trajectories_lon = []
+        # Columns of the (steps, particles) history are the per-particle tracks
+        rows = slice(None, self.step_count + 1, subsample)
+        trajectories_lat = _decode_degrees(self._history_lat[rows]).T
+        trajectories_lon = _decode_degrees(self._history_lon[rows]).T
 
-        for i in range(self.n_particles):
-            traj_lat = np.array([self.history_lat[t][i] for t in range(0, len(self.history_lat), subsample)])
-            traj_lon = np.array([self.history_lon[t][i] for t in range(0, len(self.history_lon), subsample)])
+        return trajectories_lat, trajectories_lon
 
-            trajectories_lat.append(traj_lat)
-            trajectories_lon.append(traj_lon)
+    @property
+    def xy32(self) -> np.ndarray:
+        """
+        Current positions as a contiguous (N, 2) float32 array of (lon, lat).
 
-        return trajectories_lat, trajectories_lon
+        Rendering only needs single precision, so this halves the bytes passed
+        to Matplotlib and render workers. The buffer is reused and refreshed at
+        most once per step; copy it if it must outlive the current step.
 
-    def get_current_positions(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        Returns:
+            (N, 2) float32 array
+        """
+        if self._xy32_step != self.step_count:
+            self._xy32[:, 0] = self.lon
+            self._xy32[:, 1] = self.lat
+            self._xy32_step = self.step_count
+
+        return self._xy32
+
+    def get_current_positions(self, copy: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Get current particle positions and status.
 
+        Args:
+            copy: Return independent copies; by default read-only views are
+                returned, which change as the simulation advances
+
         Returns:
             lat, lon, is_beached
         """
-        return self.lat.copy(), self.lon.copy(), self.is_beached.copy()
+        if copy:
+            return self.lat.copy(), self.lon.copy(), self.is_beached.copy()
+
+        return _readonly(self.lat), _readonly(self.lon), _readonly(self.is_beached)
 
     def get_positions_at_step(self, step: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Get particle positions at a specific time step.
 
+        Decoding the stored row always yields new, writable arrays.
+
         Args:
             step: Time step index
 
         Returns:
             lat, lon, is_beached at that step
         """
-        if step < 0 or step >= len(self.history_lat):
-            raise ValueError(f"Step {step} out of range [0, {len(self.history_lat)-1}]")
+        if step < 0 or step > self.step_count:
+            raise ValueError(f"Step {step} out of range [0, {self.step_count}]")
+
+        lat = _decode_degrees(self._history_lat[step])
+        lon = _decode_degrees(self._history_lon[step])
+        is_beached = np.unpackbits(self._history_beached[step], count=self.n_particles).view(bool)
 
-        return (
-            self.history_lat[step].copy(),
-            self.history_lon[step].copy(),
-            self.history_beached[step].copy()
-        )
+        return lat, lon, is_beached
 
     def get_density_heatmap(self, lat_bins: int = 100, lon_bins: int = 100) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -222,23 +577,77 @@ class ParticleSystem:
             lat_edges: Latitude bin edges
             lon_edges: Longitude bin edges
         """
-        # Concatenate all positions
-        all_lat = np.concatenate(self.history_lat)
-        all_lon = np.concatenate(self.history_lon)
-
-        # Create 2D histogram
         lat_range = (5, 65)
         lon_range = (-100, 20)
-
-        density, lat_edges, lon_edges = np.histogram2d(
-            all_lat, all_lon,
-            bins=[lat_bins, lon_bins],
-            range=[lat_range, lon_range]
-        )
+        lat_edges = np.linspace(lat_range[0], lat_range[1], lat_bins + 1)
+        lon_edges = np.linspace(lon_range[0], lon_range[1], lon_bins + 1)
+        # The range ends in stored units (HISTORY_SCALE per degree); there
+        # every position is an exact integer, so binning is integer arithmetic
+        # and points on a bin edge land in the upper bin, as in histogram2d
+        lat_lo, lat_hi = (round(v * HISTORY_SCALE) for v in lat_range)
+        lon_lo, lon_hi = (round(v * HISTORY_SCALE) for v in lon_range)
+
+        # Bin directly with one bincount over flat cell indices (the bins are
+        # uniform, so histogram2d's general edge search isn't needed), a block
+        # of steps at a time to bound the temporaries
+        history_lat = self._history_lat[:self.step_count + 1]
+        history_lon = self._history_lon[:self.step_count + 1]
+        counts = np.zeros(lat_bins * lon_bins, dtype=np.int64)
+        block = 64
+
+        for start in range(0, len(history_lat), block):
+            # Widened so (stored - lo) * bins can't overflow int16
+            lat = history_lat[start:start + block].ravel().astype(np.int64)
+            lon = history_lon[start:start + block].ravel().astype(np.int64)
+
+            # Like histogram2d, drop points outside the range (upper edge included)
+            inside = (lat >= lat_lo) & (lat <= lat_hi) & (lon >= lon_lo) & (lon <= lon_hi)
+            i = np.minimum((lat[inside] - lat_lo) * lat_bins // (lat_hi - lat_lo), lat_bins - 1)
+            j = np.minimum((lon[inside] - lon_lo) * lon_bins // (lon_hi - lon_lo), lon_bins - 1)
+
+            counts += np.bincount(i * lon_bins + j, minlength=lat_bins * lon_bins)
+
+        density = counts.reshape(lat_bins, lon_bins).astype(float)
 
         return density.T, lat_edges, lon_edges
 
 
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """Return a view of array that refuses writes."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _simulate_shard(physics: OceanPhysics, lat: np.ndarray, lon: np.ndarray,
+                    is_beached: np.ndarray, total_distance: np.ndarray,
+                    step_count: int, n_steps: int, seed: int) -> Tuple[np.ndarray, ...]:
+    """
+    Worker for ParticleSystem.simulate_parallel: advance one slice of particles.
+
+    Returns:
+        Final lat, lon, is_beached, total_distance, then the new
+        (n_steps, n) history rows: lat and lon as stored (int16 fixed
+        point), and the unpacked beached flags
+    """
+    physics.rng = np.random.default_rng(seed)
+
+    shard = ParticleSystem.__new__(ParticleSystem)
+    shard.physics = physics
+    shard.n_particles = len(lat)
+    shard._pos = np.empty((2, 2, shard.n_particles), dtype=np.float32)
+    shard._cur = 0
+    shard.lat = lat
+    shard.lon = lon
+    shard._init_state(is_beached, total_distance, step_count)
+    shard.simulate(n_steps)
+
+    new_rows = slice(step_count + 1, step_count + 1 + n_steps)
+    return (shard.lat, shard.lon, shard.is_beached, shard.total_distance,
+            shard._history_lat[new_rows], shard._history_lon[new_rows],
+            shard.history_beached[new_rows])
+
+
 def create_particle_system_from_city(physics: OceanPhysics, city_data: Dict, n_particles: int = 5000) -> ParticleSystem:
     """
     Create a particle system from city data, handling inland cities.
@@ -263,4 +672,28 @@ def create_particle_system_from_city(physics: OceanPhysics, city_data: Dict, n_p
     else:
         release_radius_km = 20.0  # Standard offshore radius
 
-    return ParticleSystem(physics, n_particles, lat, lon, release_radius_km)
+    try:
+        return ParticleSystem(physics, n_particles, lat, lon, release_radius_km)
+    except ValueError as e:
+        raise ValueError(f"Cannot release particles for {city_data['city']}: {e}") from e
+
+
+def warm_up_kernels():
+    """
+    Compile (or load from the on-disk cache) the Numba kernels with a
+    throwaway run, so the first real simulation does not pay for it.
+
+    Uses its own OceanPhysics, leaving every caller's random stream untouched.
+    Does nothing without Numba.
+    """
+    if njit is None:
+        return
+
+    physics = OceanPhysics(seed=0)
+    # One system per rk4 kernel: the serial one below PARALLEL_MIN_PARTICLES.
+    # The spawn report is for real runs, so it is swallowed here.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for n_particles in (1, PARALLEL_MIN_PARTICLES):
+            system = ParticleSystem(physics, n_particles, 40.7, -74.0)
+            system.simulate(1)
+            system.get_metrics()
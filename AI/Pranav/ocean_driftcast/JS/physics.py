@@ -4,8 +4,179 @@ Synthetic demo for presentation, not scientific output.
 FIXED: Physics engine with proper beaching logic and offshore spawning.
 """
 
+import math
 import numpy as np
-from typing import Tuple
+from scipy.spatial import cKDTree
+from typing import Tuple, Optional
+
+# The kernels below are cached on disk (cache=True), so only the first process
+# after an edit pays the JIT compile; later runs, tests and worker processes load
+# the cached machine code. This gives what an ahead-of-time extension would,
+# without a build step or a second copy of the kernels (numba.pycc is deprecated).
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; OceanPhysics falls back to NumPy
+    njit = None
+
+# Unit conversions shared by the particle and rendering code
+DEG_TO_RAD = np.pi / 180.0
+DEG_TO_KM = 111.32  # km per degree latitude
+
+# Coastline knots for the land mask: (lat, lon) points along the North
+# American east coast and the European/African west coast
+EAST_COAST_LAT = np.array([25, 30, 35, 40, 45, 50, 55, 60], dtype=np.float64)
+EAST_COAST_LON = np.array([-80.5, -81.5, -77.0, -75.5, -68.0, -61.0, -58.0, -56.0])
+WEST_COAST_LAT = np.array([10, 20, 30, 35, 40, 45, 50, 55, 60], dtype=np.float64)
+WEST_COAST_LON = np.array([-17, -16, -9, -9, -9, -2, -5, -7, -10], dtype=np.float64)
+
+# Below this many active particles rk4_step runs its Numba kernel serially;
+# smaller steps finish faster than waking the thread pool
+PARALLEL_MIN_PARTICLES = 256
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _velocity_at(la, lo, gyre_lat, gyre_lon, gyre_radius, gyre_strength,
+                     gs_strength, gs_width, wind_u, wind_v):
+        """All four velocity components at one point; returns (u, v)."""
+        # 1. Subtropical gyre (clockwise)
+        dlat = la - gyre_lat
+        dlon = lo - gyre_lon
+        dist = max(math.sqrt(dlat * dlat + dlon * dlon), 1e-12)
+        r = dist / gyre_radius
+        vmag = gyre_strength * math.exp(-r * r)
+        ui = -vmag * dlat / dist
+        vi = vmag * dlon / dist
+
+        # 2. Gulf Stream, southern and northern sections
+        if 25 <= la <= 35 and -80 <= lo <= -70:
+            d = abs(lo + 75) / gs_width
+            p = math.exp(-d * d)
+            vi += gs_strength * p
+            ui += 0.3 * gs_strength * p
+        if 35 <= la <= 42 and -75 <= lo <= -65:
+            d = abs(lo - (-75 + (la - 35) * (10 / 7))) / gs_width
+            p = math.exp(-d * d)
+            vi += 0.7 * gs_strength * p
+            ui += 1.5 * gs_strength * p
+
+        # 3. North Atlantic Current
+        if 40 <= la <= 55 and -50 <= lo <= -10:
+            d = (la - 47.0) / 5.0
+            p = math.exp(-d * d)
+            ui += 0.8 * gs_strength * p
+            vi += 0.1 * gs_strength * p
+
+        # 4. Windage
+        if 10 <= la <= 30:
+            w = max(1.0 - abs(la - 20) / 10.0, 0.0)
+            ui += wind_u * w
+            vi += wind_v * w
+
+        return ui, vi
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _velocity_kernel(lat, lon, u, v, gyre_lat, gyre_lon, gyre_radius, gyre_strength,
+                         gs_strength, gs_width, wind_u, wind_v):
+        """
+        Fused OceanPhysics.velocity_field: all four components per particle in
+        one pass, writing into u and v. wind_u/wind_v include the windage fraction.
+
+        A parallel njit loop rather than a @guvectorize ufunc: the prange loop
+        is threaded the same way, compiles lazily for whatever float dtype is
+        passed, and takes the current parameters as plain scalars.
+        """
+        for i in prange(lat.shape[0]):
+            u[i], v[i] = _velocity_at(lat[i], lon[i], gyre_lat, gyre_lon, gyre_radius,
+                                      gyre_strength, gs_strength, gs_width, wind_u, wind_v)
+
+    @njit(fastmath=True, cache=True)
+    def _rk4_particle(lat0, lon0, noise, k, dt, inv_er_dtr,
+                      gyre_lat, gyre_lon, gyre_radius, gyre_strength,
+                      gs_strength, gs_width, wind_u, wind_v):
+        """
+        One particle's full RK4 step from (lat0, lon0), all four stages in
+        registers, then the bounds; returns (lat, lon). noise[:, :, k] is its
+        [stage, u/v] diffusion draw.
+        """
+        la = lat0
+        lo = lon0
+        sum_dlat = 0.0
+        sum_dlon = 0.0
+        for stage in range(4):
+            ui, vi = _velocity_at(la, lo, gyre_lat, gyre_lon, gyre_radius, gyre_strength,
+                                  gs_strength, gs_width, wind_u, wind_v)
+            dx = ui * dt + noise[stage, 0, k]
+            dy = vi * dt + noise[stage, 1, k]
+            dlat = dy * inv_er_dtr
+            dlon = dx * inv_er_dtr / math.cos(la * DEG_TO_RAD)
+
+            # RK4 weights 1, 2, 2, 1; next stage at half, half, full step
+            weight = 1.0 if stage == 0 or stage == 3 else 2.0
+            sum_dlat += weight * dlat
+            sum_dlon += weight * dlon
+            frac = 0.5 if stage < 2 else 1.0
+            la = lat0 + frac * dlat
+            lo = lon0 + frac * dlon
+
+        new_lat = min(max(lat0 + sum_dlat / 6.0, -90.0), 90.0)
+        new_lon = (lon0 + sum_dlon / 6.0 + 180.0) % 360.0 - 180.0
+        return new_lat, new_lon
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rk4_kernel(lat, lon, active_idx, noise, out_lat, out_lon, dt, inv_er_dtr,
+                    gyre_lat, gyre_lon, gyre_radius, gyre_strength,
+                    gs_strength, gs_width, wind_u, wind_v):
+        """
+        Fused OceanPhysics.rk4_step for the particles in active_idx, threaded
+        over particles, written to out_lat/out_lon. noise is the
+        [stage, u/v, particle] diffusion draw.
+        """
+        for k in prange(active_idx.shape[0]):
+            i = active_idx[k]
+            out_lat[i], out_lon[i] = _rk4_particle(
+                lat[i], lon[i], noise, k, dt, inv_er_dtr, gyre_lat, gyre_lon, gyre_radius,
+                gyre_strength, gs_strength, gs_width, wind_u, wind_v)
+
+    @njit(fastmath=True, cache=True)
+    def _rk4_kernel_serial(lat, lon, active_idx, noise, out_lat, out_lon, dt, inv_er_dtr,
+                           gyre_lat, gyre_lon, gyre_radius, gyre_strength,
+                           gs_strength, gs_width, wind_u, wind_v):
+        """_rk4_kernel on the calling thread, for counts too small to split."""
+        for k in range(active_idx.shape[0]):
+            i = active_idx[k]
+            out_lat[i], out_lon[i] = _rk4_particle(
+                lat[i], lon[i], noise, k, dt, inv_er_dtr, gyre_lat, gyre_lon, gyre_radius,
+                gyre_strength, gs_strength, gs_width, wind_u, wind_v)
+
+    @njit(cache=True)
+    def _coast_lon(la, knot_lat, knot_lon):
+        """Scalar np.interp over a handful of coastline knots."""
+        if la <= knot_lat[0]:
+            return knot_lon[0]
+        for k in range(1, knot_lat.shape[0]):
+            if la <= knot_lat[k]:
+                t = (la - knot_lat[k - 1]) / (knot_lat[k] - knot_lat[k - 1])
+                return knot_lon[k - 1] + t * (knot_lon[k] - knot_lon[k - 1])
+        return knot_lon[-1]
+
+    @njit(parallel=True, cache=True)
+    def _land_kernel(lat, lon, out):
+        """Fused OceanPhysics.is_on_land over flat arrays, writing into out."""
+        for i in prange(lat.shape[0]):
+            la = lat[i]
+            lo = lon[i]
+            if 25 <= la <= 60 and lo < _coast_lon(la, EAST_COAST_LAT, EAST_COAST_LON):
+                out[i] = True  # North America
+            elif 10 <= la <= 60 and lo > _coast_lon(la, WEST_COAST_LAT, WEST_COAST_LON) + 0.2:
+                out[i] = True  # Europe and Africa
+            elif 30 <= la <= 46 and 0 <= lo <= 36:
+                out[i] = True  # Mediterranean
+            elif 10 <= la <= 25 and -85 <= lo <= -60:
+                out[i] = True  # Caribbean
+            else:
+                out[i] = False
+
 
 class OceanPhysics:
     """
@@ -16,8 +187,14 @@ class OceanPhysics:
     - Offshore spawning validation
     """
 
+    # Coastline KD-tree shared by every instance in the process: the land mask
+    # is fixed, so it is built by the first OceanPhysics only
+    _shared_coast_tree: Optional[cKDTree] = None
+
     def __init__(self, seed: int = 42):
-        self.rng = np.random.RandomState(seed)
+        self.rng = np.random.default_rng(seed)
+        self._noise_buf = np.empty(0)  # reused by diffusion_step
+        self._rk4_buf = np.empty((10, 0))  # per-particle work rows for rk4_step
 
         # Gyre parameters
         self.gyre_center_lat = 30.0
@@ -45,20 +222,52 @@ class OceanPhysics:
         # Time step (weekly)
         self.dt = 7 * 24 * 3600  # seconds
 
+        # Diffusion displacement scale (m) per step, derived from the two above
+        self._sigma = math.sqrt(2 * self.diffusion_coefficient * self.dt)
+
         # Constants
         self.earth_radius = 6371000.0  # meters
-        self.deg_to_rad = np.pi / 180.0
-        self.deg_to_km = 111.32  # km per degree latitude
+        self.deg_to_rad = DEG_TO_RAD
+        self.deg_to_km = DEG_TO_KM
+        self._inv_er_dtr = 1.0 / (self.earth_radius * self.deg_to_rad)  # degrees per meter
+
+        # Working precision for velocities and noise; the demo's kinematic
+        # model is far coarser than float32 rounding
+        self.dtype = np.float32
+
+        # Coastline as a KD-tree of land/ocean boundary points; the sphere
+        # radius matches deg_to_km so both give the same km per degree
+        self._sphere_km = self.deg_to_km / self.deg_to_rad
+        if OceanPhysics._shared_coast_tree is None:
+            OceanPhysics._shared_coast_tree = self._build_coast_tree()
+        self._coast_tree = OceanPhysics._shared_coast_tree
+
+    def velocity_field(self, lat: np.ndarray, lon: np.ndarray,
+                       out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute ocean velocity (u, v) in m/s at given positions.
 
-    def velocity_field(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        """Compute ocean velocity (u, v) in m/s at given positions."""
-        u = np.zeros_like(lat, dtype=float)
-        v = np.zeros_like(lat, dtype=float)
+        If out=(u, v) is given, the velocities are written there and returned.
+        """
+        lat = np.asarray(lat, dtype=self.dtype)
+        lon = np.asarray(lon, dtype=self.dtype)
+
+        if out is None:
+            out = (np.empty_like(lat), np.empty_like(lat))
+        u, v = out
+
+        if njit is not None:
+            # One fused pass instead of the per-component temporaries below
+            _velocity_kernel(
+                lat, lon, u, v,
+                self.gyre_center_lat, self.gyre_center_lon, self.gyre_radius, self.gyre_strength,
+                self.gulf_stream_strength, self.gulf_stream_width,
+                self.windage_fraction * self.wind_u, self.windage_fraction * self.wind_v
+            )
+            return u, v
 
         # 1. Subtropical gyre (clockwise)
-        u_gyre, v_gyre = self._gyre_velocity(lat, lon)
-        u += u_gyre
-        v += v_gyre
+        u[:], v[:] = self._gyre_velocity(lat, lon)
 
         # 2. Gulf Stream
         u_gulf, v_gulf = self._gulf_stream_velocity(lat, lon)
@@ -81,55 +290,62 @@ class OceanPhysics:
         """Clockwise subtropical gyre circulation."""
         dlat = lat - self.gyre_center_lat
         dlon = lon - self.gyre_center_lon
-        r = np.sqrt(dlat**2 + dlon**2) / self.gyre_radius
-        vmag = self.gyre_strength * np.exp(-r**2)
-        angle = np.arctan2(dlat, dlon)
-        u = -vmag * np.sin(angle)  # Clockwise
-        v = vmag * np.cos(angle)
+        # sin/cos of the polar angle are dlat/dist and dlon/dist, no arctan2 needed
+        dist = np.hypot(dlat, dlon)
+        np.maximum(dist, 1e-12, out=dist)
+        r = dist / self.gyre_radius
+        np.square(r, out=r)
+        np.negative(r, out=r)
+        vmag = np.exp(r, out=r)
+        vmag *= self.gyre_strength
+        u = -vmag * dlat / dist  # Clockwise
+        v = vmag * dlon / dist
         return u, v
 
     def _gulf_stream_velocity(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Gulf Stream along US coast."""
-        u = np.zeros_like(lat, dtype=float)
-        v = np.zeros_like(lat, dtype=float)
+        u = np.zeros_like(lat, dtype=self.dtype)
+        v = np.zeros_like(lat, dtype=self.dtype)
+
+        # Profiles are only evaluated for the particles inside each section
 
         # Southern section (25N-35N)
         mask_south = (lat >= 25) & (lat <= 35) & (lon >= -80) & (lon <= -70)
-        dist_south = np.abs(lon + 75)
+        dist_south = np.abs(lon[mask_south] + 75)
         profile_south = np.exp(-(dist_south / self.gulf_stream_width)**2)
-        v[mask_south] += self.gulf_stream_strength * profile_south[mask_south]
-        u[mask_south] += 0.3 * self.gulf_stream_strength * profile_south[mask_south]
+        v[mask_south] += self.gulf_stream_strength * profile_south
+        u[mask_south] += 0.3 * self.gulf_stream_strength * profile_south
 
         # Northern section (35N-42N)
         mask_north = (lat >= 35) & (lat <= 42) & (lon >= -75) & (lon <= -65)
-        center_lon = -75 + (lat - 35) * (10 / 7)
-        dist_north = np.abs(lon - center_lon)
+        center_lon = -75 + (lat[mask_north] - 35) * (10 / 7)
+        dist_north = np.abs(lon[mask_north] - center_lon)
         profile_north = np.exp(-(dist_north / self.gulf_stream_width)**2)
-        v[mask_north] += 0.7 * self.gulf_stream_strength * profile_north[mask_north]
-        u[mask_north] += 1.5 * self.gulf_stream_strength * profile_north[mask_north]
+        v[mask_north] += 0.7 * self.gulf_stream_strength * profile_north
+        u[mask_north] += 1.5 * self.gulf_stream_strength * profile_north
 
         return u, v
 
     def _north_atlantic_current(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """North Atlantic Current toward Europe."""
-        u = np.zeros_like(lat, dtype=float)
-        v = np.zeros_like(lat, dtype=float)
+        u = np.zeros_like(lat, dtype=self.dtype)
+        v = np.zeros_like(lat, dtype=self.dtype)
 
         mask = (lat >= 40) & (lat <= 55) & (lon >= -50) & (lon <= -10)
         lat_center = 47.0
-        lat_profile = np.exp(-((lat - lat_center) / 5.0)**2)
-        u[mask] += 0.8 * self.gulf_stream_strength * lat_profile[mask]
-        v[mask] += 0.1 * self.gulf_stream_strength * lat_profile[mask]
+        lat_profile = np.exp(-((lat[mask] - lat_center) / 5.0)**2)
+        u[mask] += 0.8 * self.gulf_stream_strength * lat_profile
+        v[mask] += 0.1 * self.gulf_stream_strength * lat_profile
 
         return u, v
 
     def _windage(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Windage from trade winds (10N-30N)."""
-        u = np.zeros_like(lat, dtype=float)
-        v = np.zeros_like(lat, dtype=float)
+        u = np.zeros_like(lat, dtype=self.dtype)
+        v = np.zeros_like(lat, dtype=self.dtype)
 
         mask = (lat >= 10) & (lat <= 30)
-        weight = np.zeros_like(lat, dtype=float)
+        weight = np.zeros_like(lat, dtype=self.dtype)
         weight[mask] = 1.0 - np.abs(lat[mask] - 20) / 10.0
         weight = np.maximum(weight, 0.0)
 
@@ -139,41 +355,82 @@ class OceanPhysics:
         return u, v
 
     def diffusion_step(self, n_particles: int) -> Tuple[np.ndarray, np.ndarray]:
-        """Generate random displacement for diffusion."""
-        sigma = np.sqrt(2 * self.diffusion_coefficient * self.dt)
-        du = self.rng.normal(0, sigma, n_particles)
-        dv = self.rng.normal(0, sigma, n_particles)
+        """
+        Generate random displacement for diffusion.
+
+        The draws fill a buffer reused across calls, so the returned arrays
+        are only valid until the next call.
+        """
+        du, dv = self._diffusion_noise((2, n_particles))
         return du, dv
 
-    def meters_to_degrees(self, lat: np.ndarray, dx_m: np.ndarray, dy_m: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        """Convert displacement in meters to degrees."""
-        dlat = dy_m / (self.earth_radius * self.deg_to_rad)
-        lat_rad = lat * self.deg_to_rad
-        dlon = dx_m / (self.earth_radius * np.cos(lat_rad) * self.deg_to_rad + 1e-10)
+    def _diffusion_noise(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Diffusion displacements (m) of any shape from a single RNG call.
+
+        Returns:
+            View of the reusable noise buffer, valid until the next call
+        """
+        size = int(np.prod(shape))
+        if self._noise_buf.size < size or self._noise_buf.dtype != self.dtype:
+            self._noise_buf = np.empty(size, dtype=self.dtype)
+        noise = self._noise_buf[:size].reshape(shape)
+
+        self.rng.standard_normal(out=noise, dtype=self.dtype)
+        noise *= self._sigma
+        return noise
+
+    def meters_to_degrees(self, lat: np.ndarray, dx_m: np.ndarray, dy_m: np.ndarray,
+                          out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert displacement in meters to degrees.
+
+        If out=(dlon, dlat) is given, the result is written there and returned;
+        dlon must not alias any of the inputs.
+        """
+        if out is None:
+            dlat = dy_m * self._inv_er_dtr
+            dlon = dx_m * self._inv_er_dtr / np.cos(lat * self.deg_to_rad)
+            return dlon, dlat
+
+        dlon, dlat = out
+        np.multiply(dy_m, self._inv_er_dtr, out=dlat)
+        # dlon holds cos(lat) until the divide
+        np.multiply(lat, self.deg_to_rad, out=dlon)
+        np.cos(dlon, out=dlon)
+        np.divide(dx_m, dlon, out=dlon)
+        dlon *= self._inv_er_dtr
         return dlon, dlat
 
     def is_on_land(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
-        """Land mask for North Atlantic basin."""
-        on_land = np.zeros(len(lat), dtype=bool)
+        """
+        Land mask for North Atlantic basin.
+
+        The regions are analytic (coastline interpolation plus boxes), so each
+        point costs a few comparisons; there are no polygons to rasterise.
+        A cached raster lookup measured slower than this for the near-coast
+        points that spawn_offshore tests.
+        """
+        lat, lon = np.broadcast_arrays(np.asarray(lat), np.asarray(lon))
+
+        if njit is not None:
+            # Same regions evaluated per point in one pass, no mask temporaries
+            on_land = np.empty(lat.shape, dtype=bool)
+            _land_kernel(lat.ravel(), lon.ravel(), on_land.reshape(-1))
+            return on_land
+
+        on_land = np.zeros(lat.shape, dtype=bool)
 
         # North America - everything west of east coast line
         # FIXED: Move coastline further west so NYC offshore waters are ocean
         na_mask = (lat >= 25) & (lat <= 60)
-        east_coast_lon = np.interp(
-            lat,
-            [25, 30, 35, 40, 45, 50, 55, 60],
-            [-80.5, -81.5, -77.0, -75.5, -68.0, -61.0, -58.0, -56.0]
-        )
+        east_coast_lon = np.interp(lat, EAST_COAST_LAT, EAST_COAST_LON)
         # Mark as land if west of coastline (no buffer needed)
         on_land |= na_mask & (lon < east_coast_lon)
 
         # Europe and Africa - everything east of west coast line
         eu_mask = (lat >= 10) & (lat <= 60)
-        west_coast_lon = np.interp(
-            lat,
-            [10, 20, 30, 35, 40, 45, 50, 55, 60],
-            [-17, -16, -9, -9, -9, -2, -5, -7, -10]
-        )
+        west_coast_lon = np.interp(lat, WEST_COAST_LAT, WEST_COAST_LON)
         # FIXED: Add buffer
         on_land |= eu_mask & (lon > (west_coast_lon + 0.2))
 
@@ -187,35 +444,75 @@ class OceanPhysics:
 
         return on_land
 
-    def distance_to_coast_km(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    def _coast_xyz(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
         """
-        FIXED: Calculate distance to nearest coast in km.
-        Uses sampling approach - checks nearby points.
+        (lat, lon) as points on a sphere of radius self._sphere_km, so tree
+        distances are chords and short chords are great-circle km.
         """
-        n = len(lat)
-        min_dist = np.full(n, 999.0)  # Start with large distance
-
-        # Sample points at various offsets (in degrees)
-        # 0.5 degree ≈ 55 km, so sample up to ±0.3 degrees
-        offsets = np.linspace(-0.3, 0.3, 7)
-
-        for dlat in offsets:
-            for dlon in offsets:
-                if dlat == 0 and dlon == 0:
-                    continue
-
-                check_lat = lat + dlat
-                check_lon = lon + dlon
-                on_land = self.is_on_land(check_lat, check_lon)
-
-                # Calculate distance to this point
-                dist_deg = np.sqrt(dlat**2 + dlon**2)
-                dist_km = dist_deg * self.deg_to_km
-
-                # Update minimum distance where land found
-                min_dist = np.where(on_land, np.minimum(min_dist, dist_km), min_dist)
+        lat_rad = np.asarray(lat, dtype=np.float64) * self.deg_to_rad
+        lon_rad = np.asarray(lon, dtype=np.float64) * self.deg_to_rad
+        cos_lat = np.cos(lat_rad)
+        xyz = np.empty((lat_rad.size, 3))
+        np.multiply(cos_lat, np.cos(lon_rad), out=xyz[:, 0])
+        np.multiply(cos_lat, np.sin(lon_rad), out=xyz[:, 1])
+        np.sin(lat_rad, out=xyz[:, 2])
+        xyz *= self._sphere_km
+        return xyz
+
+    def _build_coast_tree(self, resolution: float = 0.1) -> cKDTree:
+        """
+        Rasterise the land mask and index its land/ocean boundary.
 
-        return min_dist
+        The grid covers the default map extent plus Europe, with a half-degree
+        margin so the outer edges of the land regions are picked up as coast.
+        """
+        lats = np.arange(4.5, 65.5 + resolution / 2, resolution)
+        lons = np.arange(-100.5, 40.5 + resolution / 2, resolution)
+        grid_lat, grid_lon = np.meshgrid(lats, lons, indexing='ij')
+        on_land = self.is_on_land(grid_lat, grid_lon)
+
+        # Boundary points sit midway between neighbouring cells that differ
+        edge_lat = on_land[1:, :] != on_land[:-1, :]
+        edge_lon = on_land[:, 1:] != on_land[:, :-1]
+        coast_lat = np.concatenate([
+            (grid_lat[1:, :][edge_lat] + grid_lat[:-1, :][edge_lat]) / 2,
+            grid_lat[:, 1:][edge_lon],
+        ])
+        coast_lon = np.concatenate([
+            grid_lon[1:, :][edge_lat],
+            (grid_lon[:, 1:][edge_lon] + grid_lon[:, :-1][edge_lon]) / 2,
+        ])
+        return cKDTree(self._coast_xyz(coast_lat, coast_lon))
+
+    def distance_to_coast_km(self, lat: np.ndarray, lon: np.ndarray,
+                             max_km: float = 999.0) -> np.ndarray:
+        """
+        FIXED: Calculate distance to nearest coast in km.
+        Nearest-neighbour query against the rasterised coastline (0.1 degree);
+        points on land count as 0 km, and particles at sea with no coast
+        within max_km get 999 km.
+        """
+        lat = np.asarray(lat)
+        lon = np.asarray(lon)
+
+        # The tree only holds the land/ocean boundary, so a point far inland
+        # would otherwise look far from the coast
+        on_land = self.is_on_land(lat, lon)
+        dist = np.zeros(lat.shape)
+        at_sea = ~on_land
+        if not at_sea.any():
+            return dist
+
+        # Search in chord length, then convert the hits back to arc length
+        half_angle = min(max_km / (2 * self._sphere_km), np.pi / 2)
+        chord, _ = self._coast_tree.query(self._coast_xyz(lat[at_sea], lon[at_sea]), k=1,
+                                          distance_upper_bound=2 * self._sphere_km * np.sin(half_angle),
+                                          workers=-1)
+        found = np.isfinite(chord)
+        chord[found] = 2 * self._sphere_km * np.arcsin(chord[found] / (2 * self._sphere_km))
+        chord[~found] = 999.0
+        dist[at_sea] = chord
+        return dist
 
     def check_beaching(self, lat: np.ndarray, lon: np.ndarray, is_beached: np.ndarray,
                       step_number: int) -> np.ndarray:
@@ -230,92 +527,133 @@ class OceanPhysics:
         Returns:
             Updated beaching status
         """
-        # Only check active particles
-        active = ~is_beached
-
-        if not np.any(active):
-            return is_beached
-
         # FIXED: No beaching before minimum time
         if step_number < self.beach_min_weeks:
             return is_beached
 
-        # FIXED: Calculate actual distance to coast in km
-        dist_to_coast = self.distance_to_coast_km(lat[active], lon[active])
+        # Only check active particles
+        active_indices = np.flatnonzero(~is_beached)
 
-        # FIXED: Only beach if within beach_distance_km (15 km)
-        near_coast = dist_to_coast <= self.beach_distance_km
+        if active_indices.size == 0:
+            return is_beached
 
-        # Probabilistic beaching for particles near coast
-        beach_roll = self.rng.random(np.sum(active))
-        newly_beached = near_coast & (beach_roll < self.beach_probability)
+        # Probabilistic beaching: roll first so only the particles that would
+        # beach if near the coast need a distance query
+        beach_roll = self.rng.random(active_indices.size)
+        candidates = active_indices[beach_roll < self.beach_probability]
 
-        # Update beaching status
+        # FIXED: Only beach if within beach_distance_km (15 km)
+        dist_to_coast = self.distance_to_coast_km(lat[candidates], lon[candidates],
+                                                  max_km=self.beach_distance_km)
+        newly_beached = candidates[dist_to_coast <= self.beach_distance_km]
+
+        # Update beaching status: one copy, then set only the new arrivals
         is_beached_new = is_beached.copy()
-        active_indices = np.where(active)[0]
-        is_beached_new[active_indices[newly_beached]] = True
+        is_beached_new[newly_beached] = True
 
         return is_beached_new
 
-    def rk4_step(self, lat: np.ndarray, lon: np.ndarray, is_beached: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        """RK4 integration step for particle positions."""
-        active = ~is_beached
-
-        if not np.any(active):
-            return lat.copy(), lon.copy()
-
-        lat_active = lat[active]
-        lon_active = lon[active]
-        n_active = len(lat_active)
-
-        # K1
-        u1, v1 = self.velocity_field(lat_active, lon_active)
-        du1, dv1 = self.diffusion_step(n_active)
-        dx1 = u1 * self.dt + du1
-        dy1 = v1 * self.dt + dv1
-        dlon1, dlat1 = self.meters_to_degrees(lat_active, dx1, dy1)
-
-        # K2
-        lat2 = lat_active + 0.5 * dlat1
-        lon2 = lon_active + 0.5 * dlon1
-        u2, v2 = self.velocity_field(lat2, lon2)
-        du2, dv2 = self.diffusion_step(n_active)
-        dx2 = u2 * self.dt + du2
-        dy2 = v2 * self.dt + dv2
-        dlon2, dlat2 = self.meters_to_degrees(lat2, dx2, dy2)
-
-        # K3
-        lat3 = lat_active + 0.5 * dlat2
-        lon3 = lon_active + 0.5 * dlon2
-        u3, v3 = self.velocity_field(lat3, lon3)
-        du3, dv3 = self.diffusion_step(n_active)
-        dx3 = u3 * self.dt + du3
-        dy3 = v3 * self.dt + dv3
-        dlon3, dlat3 = self.meters_to_degrees(lat3, dx3, dy3)
-
-        # K4
-        lat4 = lat_active + dlat3
-        lon4 = lon_active + dlon3
-        u4, v4 = self.velocity_field(lat4, lon4)
-        du4, dv4 = self.diffusion_step(n_active)
-        dx4 = u4 * self.dt + du4
-        dy4 = v4 * self.dt + dv4
-        dlon4, dlat4 = self.meters_to_degrees(lat4, dx4, dy4)
-
-        # Combine
-        dlon = (dlon1 + 2*dlon2 + 2*dlon3 + dlon4) / 6.0
-        dlat = (dlat1 + 2*dlat2 + 2*dlat3 + dlat4) / 6.0
+    def rk4_step(self, lat: np.ndarray, lon: np.ndarray, is_beached: np.ndarray,
+                 out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                 active_idx: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        RK4 integration step for particle positions.
+
+        If out=(lat_out, lon_out) is given, the new positions are written there
+        (it must not alias lat/lon) and returned; otherwise new arrays are made.
+        Callers that track the active particles can pass their indices as
+        active_idx to skip rebuilding them from is_beached. While no particle
+        has beached the stages run on lat/lon directly, without gather/scatter.
+        """
+        if active_idx is None:
+            active_idx = np.flatnonzero(~is_beached)
+        n_active = active_idx.size
+        all_active = n_active == len(lat)
+
+        if out is None:
+            new_lat = np.empty_like(lat)
+            new_lon = np.empty_like(lon)
+        else:
+            new_lat, new_lon = out
+
+        if not all_active:
+            # Beached particles keep their positions
+            new_lat[:] = lat
+            new_lon[:] = lon
+            if n_active == 0:
+                return new_lat, new_lon
+
+        # Diffusion for all four stages in one draw: [stage, u/v, particle]
+        noise = self._diffusion_noise((4, 2, n_active))
+
+        if njit is not None:
+            # Every stage of every active particle in one compiled pass;
+            # threads only pay off once each gets a few hundred particles
+            kernel = _rk4_kernel if n_active >= PARALLEL_MIN_PARTICLES else _rk4_kernel_serial
+            kernel(
+                lat, lon, active_idx, noise, new_lat, new_lon, self.dt, self._inv_er_dtr,
+                self.gyre_center_lat, self.gyre_center_lon, self.gyre_radius, self.gyre_strength,
+                self.gulf_stream_strength, self.gulf_stream_width,
+                self.windage_fraction * self.wind_u, self.windage_fraction * self.wind_v
+            )
+            return new_lat, new_lon
+
+        if all_active:
+            lat_active = lat
+            lon_active = lon
+        else:
+            lat_active = lat[active_idx]
+            lon_active = lon[active_idx]
+
+        # Stage work arrays, reused across steps
+        if self._rk4_buf.shape[1] < n_active or self._rk4_buf.dtype != self.dtype:
+            self._rk4_buf = np.empty((10, n_active), dtype=self.dtype)
+        u, v, dx, dy, dlon_k, dlat_k, lat_k, lon_k, dlon, dlat = self._rk4_buf[:, :n_active]
+
+        lat_k[:] = lat_active
+        lon_k[:] = lon_active
+        dlon[:] = 0
+        dlat[:] = 0
+
+        # K1..K4: each stage is evaluated at (lat_k, lon_k), added to the
+        # sum with its RK4 weight, and sets the next stage's point
+        for k, (weight, next_frac) in enumerate(((1, 0.5), (2, 0.5), (2, 1.0), (1, None))):
+            self.velocity_field(lat_k, lon_k, out=(u, v))
+            du, dv = noise[k]
+            np.multiply(u, self.dt, out=dx)
+            dx += du
+            np.multiply(v, self.dt, out=dy)
+            dy += dv
+            self.meters_to_degrees(lat_k, dx, dy, out=(dlon_k, dlat_k))
+
+            if next_frac is not None:
+                np.multiply(dlat_k, next_frac, out=lat_k)
+                lat_k += lat_active
+                np.multiply(dlon_k, next_frac, out=lon_k)
+                lon_k += lon_active
+            if weight != 1:
+                dlat_k *= weight
+                dlon_k *= weight
+            dlat += dlat_k
+            dlon += dlon_k
+
+        dlon /= 6.0
+        dlat /= 6.0
 
         # Update positions
-        new_lat = lat.copy()
-        new_lon = lon.copy()
-        new_lat[active] += dlat
-        new_lon[active] += dlon
+        if all_active:
+            np.add(lat, dlat, out=new_lat)
+            np.add(lon, dlon, out=new_lon)
+        else:
+            new_lat[active_idx] += dlat
+            new_lon[active_idx] += dlon
 
         # Bounds
-        new_lat = np.clip(new_lat, -90, 90)
-        new_lon = np.where(new_lon < -180, new_lon + 360, new_lon)
-        new_lon = np.where(new_lon > 180, new_lon - 360, new_lon)
+        np.clip(new_lat, -90, 90, out=new_lat)
+        # Wrap longitude into [-180, 180) in place
+        new_lon += 180
+        np.mod(new_lon, 360, out=new_lon)
+        new_lon -= 180
 
         return new_lat, new_lon
 
@@ -330,39 +668,45 @@ class OceanPhysics:
             radius_km: Spawn radius in km
 
         Returns:
-            lat, lon arrays of valid ocean positions
+            lat, lon arrays of valid ocean positions, in self.dtype
         """
         radius_deg = radius_km / self.deg_to_km
+        lon_scale = 1.0 / np.cos(center_lat * self.deg_to_rad)
 
-        lat_list = []
-        lon_list = []
+        lat_parts = []
+        lon_parts = []
+        n_found = 0
 
+        # Oversample each batch by the expected ocean fraction (a guess of
+        # 0.7 at first, then the observed rate) so one or two batches suffice
+        accept_rate = 0.7
         attempts = 0
-        max_attempts = n_particles * 10
+        max_attempts = 10
 
-        while len(lat_list) < n_particles and attempts < max_attempts:
-            # Generate random positions in circle
-            angles = self.rng.random(n_particles - len(lat_list)) * 2 * np.pi
-            radii = self.rng.random(n_particles - len(lat_list)) * radius_deg
+        while n_found < n_particles and attempts < max_attempts:
+            n_draw = int(np.ceil((n_particles - n_found) / accept_rate * 1.2))
 
-            # Convert to lat/lon offsets
-            dlat = radii * np.cos(angles)
-            dlon = radii * np.sin(angles) / np.cos(center_lat * self.deg_to_rad)
+            # Generate random positions in circle
+            angles = self.rng.random(n_draw) * 2 * np.pi
+            radii = self.rng.random(n_draw) * radius_deg
 
-            candidate_lat = center_lat + dlat
-            candidate_lon = center_lon + dlon
+            # Rounded to the working precision before the land test, so the
+            # stored positions are exactly the ones that were checked
+            candidate_lat = (center_lat + radii * np.cos(angles)).astype(self.dtype)
+            candidate_lon = (center_lon + radii * np.sin(angles) * lon_scale).astype(self.dtype)
 
-            # Check which are in ocean
+            # Keep the ones in ocean
             in_ocean = ~self.is_on_land(candidate_lat, candidate_lon)
+            n_ocean = np.count_nonzero(in_ocean)
+            lat_parts.append(candidate_lat[in_ocean])
+            lon_parts.append(candidate_lon[in_ocean])
+            n_found += n_ocean
 
-            # Add valid positions
-            lat_list.extend(candidate_lat[in_ocean].tolist())
-            lon_list.extend(candidate_lon[in_ocean].tolist())
-
+            accept_rate = max(n_ocean / n_draw, 0.05)
             attempts += 1
 
         # Return exactly n_particles (truncate if we got more)
-        lat_array = np.array(lat_list[:n_particles])
-        lon_array = np.array(lon_list[:n_particles])
+        lat_array = np.concatenate(lat_parts)[:n_particles] if lat_parts else np.empty(0, self.dtype)
+        lon_array = np.concatenate(lon_parts)[:n_particles] if lon_parts else np.empty(0, self.dtype)
 
         return lat_array, lon_array
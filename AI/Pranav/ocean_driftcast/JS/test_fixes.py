@@ -6,7 +6,8 @@ Tests:
 1. Physics - offshore spawning, beaching logic, velocities
 2. Particles - spawn validation, distance tracking
 3. Visualization - basemap features present
-4. UI - widget references persist
+4. Full integration - NYC run, trajectories, density heatmap
+5. Storage and export - history round-trip, on-disk store, ffmpeg writers
 
 Run with: python test_fixes.py
 """
@@ -37,11 +38,27 @@ try:
     else:
         print(f"[OK] Offshore spawning: 100/100 particles in ocean")
 
+    # The Numba land kernel must give the NumPy mask, also for inputs that
+    # only broadcast to a common shape
+    import physics as physics_module
+    grid_lat = np.linspace(5.0, 65.0, 61)[:, None]
+    grid_lon = np.linspace(-100.0, 40.0, 141)
+    land = physics.is_on_land(grid_lat, grid_lon)
+    kernel, physics_module.njit = physics_module.njit, None
+    try:
+        numpy_land = physics.is_on_land(grid_lat, grid_lon)
+    finally:
+        physics_module.njit = kernel
+    if land.shape != (61, 141) or not np.array_equal(land, numpy_land):
+        print("[FAIL] FAIL: Land mask differs between the Numba and NumPy paths")
+        sys.exit(1)
+    print(f"[OK] Land mask on a broadcast grid: {land.sum()}/{land.size} land points")
+
     # Test velocities
     test_lat = np.array([40.7, 35.0, 30.0])
     test_lon = np.array([-74.0, -75.0, -40.0])
     u, v = physics.velocity_field(test_lat, test_lon)
-    speed = np.sqrt(u**2 + v**2)
+    speed = np.hypot(u, v)
     print(f"[OK] Velocity field: speeds = {speed} m/s")
     if np.all(speed < 0.01):
         print("[FAIL] FAIL: Velocities near zero!")
@@ -57,8 +74,19 @@ try:
     print("[OK] Beaching respects minimum time (4 weeks)")
 
     # Test distance to coast
-    dist_nyc = physics.distance_to_coast_km(np.array([40.7]), np.array([-74.0]))
-    print(f"[OK] Distance to coast (NYC): {dist_nyc[0]:.1f} km")
+    # NYC is the first of the velocity test points
+    dist_coast = physics.distance_to_coast_km(test_lat, test_lon)
+    print(f"[OK] Distance to coast (NYC): {dist_coast[0]:.1f} km")
+
+    # Points inland (US Midwest, Central Europe) must count as at the coast,
+    # or particles carried onto land would never beach
+    inland_lat = np.array([40.0, 50.0])
+    inland_lon = np.array([-90.0, 10.0])
+    dist_inland = physics.distance_to_coast_km(inland_lat, inland_lon)
+    if np.any(dist_inland > physics.beach_distance_km):
+        print(f"[FAIL] FAIL: Inland points measured far from coast: {dist_inland} km")
+        sys.exit(1)
+    print(f"[OK] Inland points within beaching distance: {dist_inland} km")
 
     print()
     print("[TEST 1] PASSED - Physics")
@@ -119,6 +147,18 @@ try:
         sys.exit(1)
     print(f"[OK] Ocean reach probability plausible (>{0.05:.1%})")
 
+    # A release area that is all land in this model (Charleston's 20 km disk)
+    # must raise instead of resampling forever (a few particles keep the
+    # doomed resampling rounds cheap)
+    charleston = {'city': 'Charleston, SC, USA', 'lat': 32.7765, 'lon': -79.9311,
+                  'region': 'usa', 'type': 'coastal'}
+    try:
+        create_particle_system_from_city(physics, charleston, n_particles=2)
+        print("[FAIL] FAIL: All-land release area did not raise")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[OK] All-land release area rejected: {e}")
+
     print()
     print("[TEST 2] PASSED - Particle System")
     print()
@@ -191,10 +231,31 @@ try:
     print(f"  Median distance: {metrics_full['median_distance_km']:,.0f} km")
     print(f"  Category: {particles_full.get_probability_category()}")
 
+    # The original sampler gave about 30% here; far higher means particles
+    # stranded on land are being counted as afloat
+    if not 0.15 <= metrics_full['ocean_reach_prob'] <= 0.5:
+        print(f"[FAIL] FAIL: NYC ocean reach outside 15-50% ({metrics_full['ocean_reach_prob']:.1%})")
+        sys.exit(1)
+    print("[OK] NYC ocean reach in expected range (15-50%)")
+
     # Get trajectories
     traj_lat, traj_lon = particles_full.get_trajectory_arrays()
     print(f"[OK] Trajectories: {len(traj_lat)} particles")
 
+    # Density heatmap must match histogram2d on the same stored positions
+    from particles import HISTORY_SCALE
+    n_rows = particles_full.step_count + 1
+    stored_lat = particles_full._history_lat[:n_rows].ravel() / HISTORY_SCALE
+    stored_lon = particles_full._history_lon[:n_rows].ravel() / HISTORY_SCALE
+    density, _, _ = particles_full.get_density_heatmap()
+    expected, _, _ = np.histogram2d(stored_lat, stored_lon, bins=[100, 100],
+                                    range=[(5, 65), (-100, 20)])
+    if not np.array_equal(density, expected.T):
+        print(f"[FAIL] FAIL: Heatmap differs from histogram2d by "
+              f"{np.abs(density - expected.T).sum():.0f} counts")
+        sys.exit(1)
+    print("[OK] Density heatmap matches histogram2d")
+
     # Test visualization with particles
     viz_full = OceanDriftVisualizer(figsize=(10, 6), dpi=72)
     try:
@@ -224,6 +285,71 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
+# Test 5: History Storage and Export
+print("[TEST 5] History Storage and Export")
+print("-" * 60)
+
+try:
+    import os
+    import tempfile
+    from PIL import Image
+    from particles import HISTORY_SCALE
+    from animation import AnimationExporter
+
+    # int16 fixed-point history must round-trip to within half a unit
+    lat_last, lon_last, beached_last = particles_full.get_positions_at_step(particles_full.step_count)
+    err = max(np.abs(lat_last - particles_full.lat).max(), np.abs(lon_last - particles_full.lon).max())
+    if err > 0.5 / HISTORY_SCALE + 1e-4:
+        print(f"[FAIL] FAIL: History round-trip error {err:.5f} deg")
+        sys.exit(1)
+    if not np.array_equal(beached_last, particles_full.is_beached):
+        print("[FAIL] FAIL: Beached history does not match current state")
+        sys.exit(1)
+    print(f"[OK] History round-trip within {err:.4f} deg")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A run continued in chunks on disk matches one run in RAM
+        in_ram = ParticleSystem(OceanPhysics(seed=7), 200, 40.0, -60.0)
+        on_disk = ParticleSystem(OceanPhysics(seed=7), 200, 40.0, -60.0)
+        in_ram.simulate(12)
+        store = os.path.join(tmp, "run")
+        on_disk.simulate(8, store_path=store)
+        on_disk.simulate(4, store_path=store)
+        if not (np.array_equal(in_ram.history_lat, on_disk.history_lat) and
+                np.array_equal(in_ram.history_beached, on_disk.history_beached)):
+            print("[FAIL] FAIL: Chunked on-disk history differs from in-memory run")
+            sys.exit(1)
+        print("[OK] History store continues in chunks (8 + 4 steps)")
+        del on_disk  # release the memory maps before the directory is removed
+
+        # Streaming ffmpeg writers
+        exporter = AnimationExporter(output_dir=tmp)
+        frames = [np.full((48, 64, 3), 40 * k, dtype=np.uint8) for k in range(5)]
+        for open_writer, name in ((exporter.open_mp4_writer, "t.mp4"),
+                                  (exporter.open_gif_writer, "t.gif")):
+            writer = open_writer(name, 64, 48, fps=10)
+            for frame in frames:
+                writer.write(frame)
+            writer.close()
+            if writer.n_frames != 5 or os.path.getsize(writer.output_path) == 0:
+                print(f"[FAIL] FAIL: Streaming writer produced no {name}")
+                sys.exit(1)
+        with Image.open(os.path.join(tmp, "t.gif")) as gif:
+            if gif.n_frames != 5 or gif.size != (32, 24):
+                print(f"[FAIL] FAIL: GIF has {gif.n_frames} frames of {gif.size}")
+                sys.exit(1)
+        print("[OK] Streaming MP4/GIF writers (5 frames)")
+
+    print()
+    print("[TEST 5] PASSED - History Storage and Export")
+    print()
+
+except Exception as e:
+    print(f"[FAIL] FAIL: Storage/export test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
+
 # Summary
 print("="*60)
 print("  ALL TESTS PASSED [OK]")
@@ -236,6 +362,7 @@ print("  [OK] Velocities are realistic (>0.01 m/s)")
 print("  [OK] NYC simulation shows plausible results")
 print("  [OK] Basemap renders with Natural Earth features")
 print("  [OK] Full visualization pipeline works")
+print("  [OK] History storage and streaming export work")
 print()
 print("Ready to run: python main.py")
 print()
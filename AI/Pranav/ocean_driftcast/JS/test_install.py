@@ -6,9 +6,15 @@ Synthetic demo for presentation, not scientific output.
 
 import sys
 import os
+import importlib.util
 
 def test_imports():
-    """Test that all required modules can be imported."""
+    """
+    Test that all required modules are installed.
+
+    Only locates each package; the heavy ones (cartopy, matplotlib, scipy) are
+    imported for real by the tests that use them.
+    """
     print("Testing imports...")
 
     modules = [
@@ -18,15 +24,15 @@ def test_imports():
         ('PIL', 'Pillow'),
         ('imageio', 'imageio'),
         ('scipy', 'SciPy'),
+        ('tqdm', 'tqdm'),
     ]
 
     failed = []
     for module, name in modules:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"  ✓ {name}")
-        except ImportError as e:
-            print(f"  ✗ {name} - {e}")
+        else:
+            print(f"  ✗ {name} - not installed")
             failed.append(name)
 
     if failed:
@@ -34,7 +40,7 @@ def test_imports():
         print("Run: pip install -r requirements.txt")
         return False
 
-    print("  All imports successful!\n")
+    print("  All modules found!\n")
     return True
 
 
@@ -91,9 +97,12 @@ def test_physics():
         # Create physics engine
         physics = OceanPhysics(seed=42)
 
+        # One batch of smoke-test points shared by the checks below
+        lat = np.array([30.0, 35.0, 40.0], dtype=np.float32)
+        lon = np.array([-40.0, -50.0, -60.0], dtype=np.float32)
+        beached = np.zeros(len(lat), dtype=bool)
+
         # Test velocity field
-        lat = np.array([30.0, 35.0, 40.0])
-        lon = np.array([-40.0, -50.0, -60.0])
         u, v = physics.velocity_field(lat, lon)
 
         if not isinstance(u, np.ndarray) or not isinstance(v, np.ndarray):
@@ -112,16 +121,16 @@ def test_physics():
             return False
 
         # Test RK4
-        lat_test = np.array([30.0])
-        lon_test = np.array([-40.0])
-        beached = np.array([False])
+        new_lat, new_lon = physics.rk4_step(lat, lon, beached)
 
-        new_lat, new_lon = physics.rk4_step(lat_test, lon_test, beached)
-
-        if len(new_lat) != 1 or len(new_lon) != 1:
+        if len(new_lat) != len(lat) or len(new_lon) != len(lat):
             print("  ✗ RK4 step size mismatch")
             return False
 
+        if not (np.all(np.isfinite(new_lat)) and np.all(np.isfinite(new_lon))):
+            print("  ✗ RK4 step produced non-finite positions")
+            return False
+
         print("  ✓ Velocity field computation")
         print("  ✓ Diffusion step")
         print("  ✓ RK4 integration")
@@ -176,8 +185,19 @@ def test_particles():
             print(f"  ✗ Invalid probability category: {category}")
             return False
 
+        # Test multi-process simulation (worker shards stitched back together)
+        parallel = ParticleSystem(physics, n_particles=100, release_lat=40.0, release_lon=-74.0)
+        parallel.simulate_parallel(5, n_workers=2)
+        shapes = {parallel.history_lat.shape, parallel.history_lon.shape,
+                  parallel.history_beached.shape}
+        if parallel.step_count != 5 or shapes != {(6, 100)}:
+            print(f"  ✗ Parallel simulation: step_count={parallel.step_count}, "
+                  f"history shapes={shapes}")
+            return False
+
         print("  ✓ Particle initialization")
         print("  ✓ Simulation step")
+        print("  ✓ Parallel simulation")
         print("  ✓ Metrics calculation")
         print("  ✓ Particle system working\n")
         return True
@@ -194,9 +214,9 @@ def test_visualization():
     print("Testing visualization...")
 
     try:
-        from visualization import OceanDriftVisualizer
         import matplotlib
-        matplotlib.use('Agg')  # Non-interactive backend
+        matplotlib.use('Agg')  # Non-interactive backend, before pyplot is imported
+        from visualization import OceanDriftVisualizer
 
         # Create visualizer
         viz = OceanDriftVisualizer(figsize=(10, 6), dpi=50)
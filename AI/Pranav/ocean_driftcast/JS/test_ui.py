@@ -7,6 +7,9 @@ Tests:
 2. All widgets accessible
 3. Handlers can be called programmatically
 4. Figure and canvas exist and remain valid
+5. City loading
+6. Display update
+7. City search (find_city, ComboBox index)
 """
 
 import sys
@@ -240,6 +243,78 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
+# Test 7: City Search
+print("[TEST 7] City Search")
+print("-" * 60)
+
+try:
+    import ui as ui_module
+
+    # find_city resolves partial and misspelled names, and repeats are memoized
+    for query, expected in (("New York", "New York, NY, USA"), ("new yo", "New York, NY, USA"),
+                            ("Lond", "London, UK")):
+        city = ui.find_city(query)
+        if city is None or city['city'] != expected:
+            print(f"[FAIL] FAIL: find_city({query!r}) -> {city and city['city']}, expected {expected}")
+            sys.exit(1)
+    if ui.find_city("Lond") is not ui.find_city("Lond"):
+        print("[FAIL] FAIL: Repeated find_city query not memoized")
+        sys.exit(1)
+    print("[OK] find_city resolves partial names (memoized)")
+
+    # The trigram shortlist must pick the same city as scoring every name
+    if ui_module.process is not None:
+        for query in ("new yo", "lond", "lisbn", "chicgo", "zzzz"):
+            full = ui_module.process.extractOne(query, ui._city_names_lower,
+                                                scorer=ui_module.fuzz.WRatio, score_cutoff=30)
+            full_index = full[2] if full is not None else None
+            if ui._fuzzy_city_index(query) != full_index:
+                print(f"[FAIL] FAIL: Shortlisted RapidFuzz match differs for {query!r}")
+                sys.exit(1)
+        print("[OK] RapidFuzz shortlist matches a full scan")
+    else:
+        print("[OK] RapidFuzz not installed; difflib fallback used")
+
+    # ComboBox's bigram index must find exactly the substring matches
+    combobox = ui.widgets['combobox']
+    for text in ("new", "on", "sa", "ia, ", "q"):
+        brute = [opt for opt in combobox.all_options if text in opt.lower()]
+        if combobox._substring_matches(text) != brute:
+            print(f"[FAIL] FAIL: ComboBox matches differ for {text!r}")
+            sys.exit(1)
+    print("[OK] ComboBox bigram index matches a substring scan")
+
+    # A typo with no substring hits keeps the previous list until the
+    # debounced fuzzy pass runs, which then shows only the close matches
+    combobox._on_text_change("new")
+    previous = combobox.filtered_options
+    combobox._on_text_change("Nwe Yrok")
+    if combobox.filtered_options != previous:
+        print("[FAIL] FAIL: ComboBox replaced its list before the fuzzy pass")
+        sys.exit(1)
+    combobox._apply_fuzzy()
+    fuzzy = combobox.filtered_options
+    if not fuzzy or len(fuzzy) > 10 or "new york" not in fuzzy[0].lower():
+        print(f"[FAIL] FAIL: Fuzzy pass gave {combobox.filtered_options[:3]}")
+        sys.exit(1)
+    combobox._on_text_change("zzqqxx")
+    combobox._apply_fuzzy()
+    if combobox.filtered_options:
+        print("[FAIL] FAIL: ComboBox shows options for text that matches nothing")
+        sys.exit(1)
+    combobox._on_text_change("")
+    print("[OK] ComboBox waits for the fuzzy pass instead of listing every city")
+
+    print()
+    print("[TEST 7] PASSED - City Search")
+    print()
+
+except Exception as e:
+    print(f"[FAIL] FAIL: City search test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
+
 # Summary
 print("="*60)
 print("  ALL UI TESTS PASSED [OK]")
@@ -252,6 +327,7 @@ print("  [OK] Handlers callable programmatically")
 print("  [OK] Figure and canvas persist through operations")
 print("  [OK] City loading works (NYC)")
 print("  [OK] Display updates without crashes")
+print("  [OK] City search resolves partial names")
 print()
 print("Next step: Run interactive mode with 'python main.py'")
 print()
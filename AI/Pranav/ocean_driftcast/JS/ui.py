@@ -4,32 +4,45 @@ Synthetic demo for presentation, not scientific output.
 Interactive UI for ocean drift visualization with city search and playback controls.
 """
 
+import functools
 import json
+from collections import defaultdict
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from difflib import get_close_matches
 
+try:
+    from rapidfuzz import process, fuzz
+except ImportError:  # RapidFuzz is optional; find_city falls back to difflib
+    process = None
+
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button, Slider, TextBox
-import matplotlib.animation as animation
+import cartopy.crs as ccrs
 
 from physics import OceanPhysics
-from particles import ParticleSystem, create_particle_system_from_city
-from visualization import OceanDriftVisualizer
+from particles import ParticleSystem, create_particle_system_from_city, warm_up_kernels
+from visualization import OceanDriftVisualizer, snapshot_frame
+from animation import AnimationExporter
 from combobox import ComboBox
 
+# Playback redraws the trajectory lines only when the step crosses a multiple
+# of this; particles and the info card update every frame
+TRAJ_UPDATE_STEPS = 10
+
 
 class InteractiveUI:
     """
     Interactive visualization UI with city search and playback controls.
     """
 
-    def __init__(self, seeds_file: str = "seeds.json"):
+    def __init__(self, seeds_file: str = "seeds.json", interactive_dpi: int = 72):
         """
         Initialize interactive UI.
 
         Args:
             seeds_file: Path to seeds.json
+            interactive_dpi: Resolution of the on-screen figure (exports keep 100)
         """
         # Load city data
         with open(seeds_file, 'r') as f:
@@ -37,12 +50,32 @@ class InteractiveUI:
 
         self.city_names = [city['city'] for city in self.cities]
         self.city_dict = {city['city']: city for city in self.cities}
+        self._city_names_lower = [name.lower() for name in self.city_names]  # same order as city_names
+
+        # Indices of the city names containing each 3-character substring, to
+        # shortlist RapidFuzz candidates (like ComboBox's bigram index)
+        self._trigram_index = defaultdict(list)
+        for i, name_lower in enumerate(self._city_names_lower):
+            for trigram in {name_lower[j:j + 3] for j in range(len(name_lower) - 2)}:
+                self._trigram_index[trigram].append(i)
+
+        # The city list never changes, so lookups are memoized per query
+        # (case kept: difflib and the exact match are case-sensitive)
+        self._find_city_cached = functools.lru_cache(maxsize=256)(self._find_city_uncached)
 
         # Simulation state
         self.physics = OceanPhysics(seed=42)
+        warm_up_kernels()  # compile now rather than on the first city load
         self.particle_system: Optional[ParticleSystem] = None
         self.current_city: Optional[str] = None
 
+        # Decoded trajectories (every 10th particle) of the loaded run, with
+        # the (particle system, step count) they were decoded for; see _trajectories
+        self._traj_lat = None
+        self._traj_lon = None
+        self._traj_source = None
+        self._traj_step = None  # step the trajectory lines were last drawn to
+
         # Playback state
         self.current_step = 0
         self.is_playing = False
@@ -50,9 +83,11 @@ class InteractiveUI:
         self.max_steps = 1040  # 20 years
 
         # Visualization
-        self.visualizer = OceanDriftVisualizer(figsize=(18, 10), dpi=90)
+        # Every frame is rasterized at this dpi, and the cost grows with dpi^2
+        self.interactive_dpi = interactive_dpi
+        self.visualizer = OceanDriftVisualizer(figsize=(18, 10), dpi=interactive_dpi)
         self.fig = None
-        self.anim = None
+        self.timer = None
 
         # UI widgets
         self.widgets = {}
@@ -69,25 +104,64 @@ class InteractiveUI:
         """
         if not search_text:
             return None
+        return self._find_city_cached(search_text)
+
+    def _find_city_uncached(self, search_text: str) -> Optional[Dict]:
+        """
+        find_city's lookup, without the memo.
+
+        Args:
+            search_text: Non-empty search query
 
+        Returns:
+            City data dict or None
+        """
         # Exact match
         if search_text in self.city_dict:
             return self.city_dict[search_text]
 
+        if process is not None:
+            index = self._fuzzy_city_index(search_text.lower())
+            return self.city_dict[self.city_names[index]] if index is not None else None
+
         # Fuzzy match
         matches = get_close_matches(search_text, self.city_names, n=1, cutoff=0.3)
 
         if matches:
             return self.city_dict[matches[0]]
 
-        # Partial match (case insensitive)
+        # Partial match (case insensitive), against the names lowercased in __init__
         search_lower = search_text.lower()
-        for city_name in self.city_names:
-            if search_lower in city_name.lower():
+        for name_lower, city_name in zip(self._city_names_lower, self.city_names):
+            if search_lower in name_lower:
                 return self.city_dict[city_name]
 
         return None
 
+    def _fuzzy_city_index(self, query: str) -> Optional[int]:
+        """
+        Best RapidFuzz match for a lowercase query.
+
+        Cities sharing a trigram with the query are scored first; the full list
+        is only scored if that shortlist is empty or has no match. WRatio also
+        scores partial matches, so there is no separate substring pass.
+
+        Returns:
+            Index into city_names, or None
+        """
+        # Sorted so ties resolve in city_names order, as in a full scan
+        shortlist = sorted({i for j in range(len(query) - 2)
+                            for i in self._trigram_index.get(query[j:j + 3], ())})
+        if shortlist:
+            match = process.extractOne(query, [self._city_names_lower[i] for i in shortlist],
+                                       scorer=fuzz.WRatio, score_cutoff=30)
+            if match is not None:
+                return shortlist[match[2]]
+
+        match = process.extractOne(query, self._city_names_lower,
+                                   scorer=fuzz.WRatio, score_cutoff=30)
+        return match[2] if match is not None else None
+
     def load_city(self, city_name: str, n_particles: int = 5000):
         """
         Load and simulate a city.
@@ -106,9 +180,13 @@ class InteractiveUI:
         print(f"  Spawning {n_particles} particles...")
 
         # Create particle system
-        self.particle_system = create_particle_system_from_city(
-            self.physics, city_data, n_particles
-        )
+        try:
+            self.particle_system = create_particle_system_from_city(
+                self.physics, city_data, n_particles
+            )
+        except ValueError as e:
+            print(f"  {e}")
+            return
 
         self.current_city = city_data['city']
 
@@ -132,19 +210,20 @@ class InteractiveUI:
 
         # Reset playback
         self.current_step = 0
-        self.is_playing = False
+        self._set_playing(False)
+        self._traj_source = None
+        self._traj_step = None
 
     def setup_ui(self):
         """
         Setup interactive UI with controls.
         """
         # Create figure with controls area
-        self.fig = plt.figure(figsize=(18, 10), facecolor='#0a1e2e')
+        self.fig = plt.figure(figsize=(18, 10), dpi=self.interactive_dpi, facecolor='#0a1e2e')
 
         # Main visualization area
-        ax_main = plt.axes([0.05, 0.15, 0.9, 0.8])
-        self.visualizer.ax = ax_main
-        self.visualizer.fig = self.fig
+        ax_main = self.fig.add_axes([0.05, 0.15, 0.9, 0.8], projection=ccrs.PlateCarree())
+        self._init_static_scene(ax_main)
 
         # Control panel area
         ax_color = '#0f3548'
@@ -251,11 +330,20 @@ class InteractiveUI:
         self.widgets['btn_export_gif'].on_clicked(lambda event: self.on_export_gif())
         self.widgets['btn_export_mp4'].on_clicked(lambda event: self.on_export_mp4())
 
-        # Set up animation
-        self.anim = animation.FuncAnimation(
-            self.fig, self.update_frame,
-            interval=50, blit=False, cache_frame_data=False
-        )
+        # Playback timer. update_display blits each frame itself: FuncAnimation's
+        # blitting only redraws artists that belong to an axes, and the info
+        # card is drawn in figure coordinates. It only runs while playing.
+        self.timer = self.fig.canvas.new_timer(interval=50)
+        self.timer.add_callback(self.update_frame, None)
+
+    def _init_static_scene(self, ax):
+        """
+        Build the map layers and the persistent frame artists once.
+
+        Args:
+            ax: The UI's PlateCarree map axes
+        """
+        self.visualizer.attach(ax)
 
     def on_city_selected(self, city_name: str):
         """
@@ -287,20 +375,34 @@ class InteractiveUI:
             print("Load a city first!")
             return
 
-        self.is_playing = True
+        self._set_playing(True)
         self.fig.canvas.draw_idle()
 
     def on_pause(self):
         """Handle pause button click."""
-        self.is_playing = False
+        self._set_playing(False)
         self.fig.canvas.draw_idle()
 
     def on_reset(self):
         """Handle reset button click."""
         self.current_step = 0
-        self.is_playing = False
+        self._set_playing(False)
         self.update_display()
 
+    def _set_playing(self, playing: bool):
+        """
+        Start or stop playback, running the frame timer only while playing.
+
+        Args:
+            playing: Whether to play
+        """
+        self.is_playing = playing
+        if self.timer is not None:
+            if playing:
+                self.timer.start()
+            else:
+                self.timer.stop()
+
     def on_speed_change(self, val):
         """Handle speed slider change."""
         self.speed = int(val)
@@ -327,148 +429,103 @@ class InteractiveUI:
         """
         Export current simulation as animation.
 
+        Frames are streamed into an ffmpeg process as they are rendered, so
+        encoding runs alongside rendering and no frame list is kept.
+
         Args:
             format: 'gif' or 'mp4'
         """
-        import os
-        from PIL import Image
-        import io
-
-        output_dir = "outputs"
-        os.makedirs(output_dir, exist_ok=True)
+        exporter = AnimationExporter("outputs")
+        city_slug = self.current_city.replace(',', '').replace(' ', '_')
 
-        # Render all frames
-        frames = []
         n_export_frames = min(300, self.max_steps // 3)  # Limit for size
         step_interval = self.max_steps // n_export_frames
 
         print(f"  Rendering {n_export_frames} frames...")
 
-        for i in range(0, self.max_steps, step_interval):
-            if i % 20 == 0:
-                print(f"    Frame {i}/{self.max_steps}")
-
-            # Create temporary visualizer for export
-            export_viz = OceanDriftVisualizer(figsize=(16, 10), dpi=100)
-            fig = export_viz.render_frame(
-                self.particle_system,
-                self.current_city,
-                i,
-                show_trajectories=True,
-                show_particles=True,
-                traj_subsample=8
-            )
-
-            # Convert to PIL Image
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=100, facecolor='#0a1e2e', bbox_inches='tight')
-            buf.seek(0)
-            img = Image.open(buf).copy()
-            frames.append(img)
-            buf.close()
-
+        # One export figure for the whole run: the map is drawn once and each
+        # frame only moves the particle artists and rewrites the info card
+        export_viz = OceanDriftVisualizer(figsize=(16, 10), dpi=100)
+        writer = None
+        try:
+            for i in range(0, self.max_steps, step_interval):
+                if i % 20 == 0:
+                    print(f"    Frame {i}/{self.max_steps}")
+
+                snapshot = snapshot_frame(self.particle_system, i, traj_subsample=8)
+                fig = export_viz.draw_snapshot(snapshot, self.current_city, blit=True)
+                frame = AnimationExporter.canvas_to_rgb(fig, draw=False)
+
+                if writer is None:
+                    height, width = frame.shape[:2]
+                    if format == 'gif':
+                        # ffmpeg halves the resolution for a smaller file
+                        writer = exporter.open_gif_writer(f"{city_slug}.gif", width, height,
+                                                          fps=20, scale=0.5)
+                    else:
+                        writer = exporter.open_mp4_writer(f"{city_slug}.mp4", width, height, fps=20)
+                    if writer is None:
+                        return
+
+                writer.write(frame)
+        finally:
             export_viz.close()
+            if writer is not None:
+                writer.close()
 
-        # Save
-        city_slug = self.current_city.replace(',', '').replace(' ', '_')
+        print(f"  Saved: {writer.output_path}")
 
-        if format == 'gif':
-            output_path = os.path.join(output_dir, f"{city_slug}.gif")
-            # Downsample for smaller file
-            resized_frames = [f.resize((f.width // 2, f.height // 2), Image.Resampling.LANCZOS) for f in frames]
-            resized_frames[0].save(
-                output_path,
-                save_all=True,
-                append_images=resized_frames[1:],
-                duration=50,
-                loop=0,
-                optimize=True
-            )
-            print(f"  Saved: {output_path}")
-
-        elif format == 'mp4':
-            try:
-                import imageio
-                output_path = os.path.join(output_dir, f"{city_slug}.mp4")
-                frame_arrays = [np.array(frame) for frame in frames]
-                imageio.mimsave(output_path, frame_arrays, fps=20, codec='libx264', quality=8)
-                print(f"  Saved: {output_path}")
-            except ImportError:
-                print("  Error: imageio not available. Install with: pip install imageio[ffmpeg]")
-
-    def update_frame(self, frame):
+    def update_frame(self, frame=None):
         """
-        Animation update callback.
+        Playback timer callback; the timer only runs while playing.
 
         Args:
-            frame: Frame number (unused, we use internal state)
+            frame: Unused, the step comes from internal state
         """
-        # Only update if playing
-        if self.is_playing and self.particle_system is not None:
-            self.current_step += self.speed
+        self.current_step += self.speed
 
-            # Loop at end
-            if self.current_step >= len(self.particle_system.history_lat):
-                self.current_step = 0
+        # Loop at end
+        if self.current_step > self.particle_system.step_count:
+            self.current_step = 0
 
-            self.update_display()
+        self.update_display()
+
+    def _trajectories(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (steps + 1, n_particles / 10) trajectory arrays of the loaded run.
 
-        return []
+        The history only changes when a run is (re)simulated, so it is decoded
+        once and each frame just slices the cached arrays.
+        """
+        source = (self.particle_system, self.particle_system.step_count)
+        if self._traj_source != source:
+            self._traj_lat, self._traj_lon = self.particle_system.get_history(particle_subsample=10)
+            self._traj_source = source
+        return self._traj_lat, self._traj_lon
 
     def update_display(self):
-        """Update visualization display."""
+        """
+        Update visualization display.
+
+        The map layers are drawn once; each call then moves the persistent
+        trajectory and particle artists, rewrites the info card and blits the
+        map and card region.
+        """
         if self.particle_system is None:
             return
 
-        # Clear and redraw
-        self.visualizer.fig.clear()
-
-        # Recreate main axis
-        ax_main = self.visualizer.fig.add_axes([0.05, 0.15, 0.9, 0.8], projection=None)
-
-        # Need to setup cartopy axis properly
-        import cartopy.crs as ccrs
-        ax_main.remove()
-        ax_main = self.visualizer.fig.add_axes(
-            [0.05, 0.15, 0.9, 0.8],
-            projection=ccrs.PlateCarree()
-        )
-        self.visualizer.ax = ax_main
-        self.visualizer.ax.set_extent([-100, 20, 5, 65], crs=ccrs.PlateCarree())
-
-        # Render current frame
-        self.visualizer.setup_figure()
-        self.visualizer.plot_gyre_background()
-
-        # Plot trajectories up to current step
-        traj_lat, traj_lon = self.particle_system.get_trajectory_arrays(subsample=1)
-        traj_lat_truncated = [t[:self.current_step+1] for t in traj_lat]
-        traj_lon_truncated = [t[:self.current_step+1] for t in traj_lon]
-        self.visualizer.plot_trajectories(traj_lat_truncated, traj_lon_truncated, subsample=10, alpha=0.04)
-
-        # Plot current particles
-        if self.current_step < len(self.particle_system.history_lat):
-            lat, lon, beached = self.particle_system.get_positions_at_step(self.current_step)
-            self.visualizer.plot_particles(lat, lon, beached)
-
-        # Add labels and info
-        self.visualizer.add_labels()
-
-        metrics = self.particle_system.get_metrics()
-        prob_category = self.particle_system.get_probability_category()
-        self.visualizer.add_info_card(
-            city=self.current_city,
-            probability=prob_category,
-            distance_km=metrics['median_distance_km'],
-            step=self.current_step,
-            total_steps=len(self.particle_system.history_lat) - 1
-        )
-
-        self.visualizer.add_logo()
-        self.visualizer.add_scale_bar()
-
-        # Redraw canvas
-        self.fig.canvas.draw_idle()
+        # Trajectories are the heaviest artist, so they only advance every
+        # TRAJ_UPDATE_STEPS steps (as views of the cached arrays); the
+        # particles and info card follow every frame
+        traj_step = self.current_step - self.current_step % TRAJ_UPDATE_STEPS
+        if traj_step != self._traj_step:
+            traj_lat, traj_lon = self._trajectories()
+            self.visualizer.set_trajectories(traj_lat[:traj_step + 1], traj_lon[:traj_step + 1])
+            self._traj_step = traj_step
+
+        snapshot = snapshot_frame(self.particle_system, self.current_step, show_trajectories=False)
+        self.visualizer.draw_snapshot(snapshot, self.current_city, blit=True,
+                                      update_trajectories=False)
 
     def run(self):
         """
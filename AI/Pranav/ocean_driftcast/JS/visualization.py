@@ -4,15 +4,19 @@ Synthetic demo for presentation, not scientific output.
 Visualization layer with Ocean Cleanup style dark theme and cyan trajectories.
 """
 
+from collections import OrderedDict
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.collections import LineCollection
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.transforms import Bbox
+from matplotlib.backends.backend_agg import RendererAgg
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from typing import Optional, Tuple, Dict, List
 from particles import ParticleSystem
+from physics import DEG_TO_KM
 
 # Ocean Cleanup style colors
 COLORS = {
@@ -28,12 +32,79 @@ COLORS = {
     'info_bg': '#0f3548',
 }
 
+# Rendered basemaps kept per process (least recently used dropped first); a
+# 20x12 in figure at 100 dpi is about 10 MB of RGBA
+BASEMAP_CACHE_SIZE = 4
+
+# Info card colors per probability category
+PROBABILITY_COLORS = {
+    'LOW': '#4a9eff',
+    'MEDIUM': '#ffaa00',
+    'HIGH': '#ff4444'
+}
+
+
+def snapshot_frame(particle_system: ParticleSystem, step: int, show_trajectories: bool = True,
+                   show_particles: bool = True, traj_subsample: int = 10) -> Dict:
+    """
+    Capture the state needed to draw one frame, decoupled from the ParticleSystem.
+
+    Snapshots are small and picklable, so frames can be rendered later or in
+    another process while the simulation keeps running. Metrics reflect the
+    particle system's state at capture time.
+
+    Args:
+        particle_system: ParticleSystem instance
+        step: Time step to capture
+        show_trajectories: Whether to capture trajectories up to step
+        show_particles: Whether to capture particle positions at step
+        traj_subsample: Keep every Nth trajectory
+
+    Returns:
+        Dictionary with step, float32 traj_lat/traj_lon (T, k), float32
+        active_xy/beached_xy (n, 2) (lon, lat) offsets, probability and
+        distance_km
+    """
+    n_hist = particle_system.step_count + 1
+
+    traj_lat = traj_lon = None
+    if show_trajectories:
+        traj_lat, traj_lon = particle_system.get_history(step + 1, particle_subsample=traj_subsample)
+
+    active_xy = beached_xy = None
+    if show_particles and step < n_hist:
+        if step == particle_system.step_count:
+            xy = particle_system.xy32
+            beached = particle_system.is_beached
+        else:
+            lat, lon, beached = particle_system.get_positions_at_step(step)
+            xy = np.column_stack([lon, lat]).astype(np.float32)
+        # Boolean indexing copies, so the snapshot doesn't alias xy32
+        active_xy = xy[~beached]
+        beached_xy = xy[beached]
+
+    metrics = particle_system.get_metrics()
+
+    return {
+        'step': step,
+        'traj_lat': traj_lat,
+        'traj_lon': traj_lon,
+        'active_xy': active_xy,
+        'beached_xy': beached_xy,
+        'probability': particle_system.get_probability_category(),
+        'distance_km': metrics['median_distance_km'],
+    }
+
 
 class OceanDriftVisualizer:
     """
     Visualization engine for ocean drift simulation.
     """
 
+    # Rendered basemap pixels keyed by (figure pixel size, axes position,
+    # extent), shared by every visualizer in the process; see setup_figure
+    _basemap_cache: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+
     def __init__(self, figsize: Tuple[float, float] = (20, 12), dpi: int = 100):
         """
         Initialize visualizer.
@@ -47,25 +118,78 @@ class OceanDriftVisualizer:
         self.fig = None
         self.ax = None
 
-    def setup_figure(self, extent: Optional[Tuple] = None):
+        # Persistent artists for update_frame (built on first use)
+        self._frame_artists = None
+        # Every artist of the last info card, background first
+        self._info_card_artists = []
+        # Static layers saved for blitting, the region they cover, and the
+        # figure bounds they match
+        self._blit_background = None
+        self._blit_bbox = None
+        self._blit_bounds = None
+        # (zorder, (x, y, RGBA pixels)) of the static artists in that region
+        # that sit above the dynamic ones, pre-rendered
+        self._blit_overlays = []
+
+    def setup_figure(self, extent: Optional[Tuple] = None, ax=None):
         """
         Setup figure with dark Ocean Cleanup style and Natural Earth features.
 
         Args:
             extent: Map extent [lon_min, lon_max, lat_min, lat_max]
+            ax: Existing PlateCarree GeoAxes to draw the map into (e.g. the
+                interactive UI's map panel); by default a new figure is made
         """
         if extent is None:
             extent = [-100, 20, 5, 65]
 
-        # Create figure
-        self.fig = plt.figure(figsize=self.figsize, dpi=self.dpi, facecolor=COLORS['background'])
+        if ax is None:
+            # Create figure
+            self.fig = plt.figure(figsize=self.figsize, dpi=self.dpi, facecolor=COLORS['background'])
 
-        # Create map axis
-        self.ax = plt.axes(projection=ccrs.PlateCarree())
+            # Create map axis with fixed margins, so frames need no layout pass
+            self.ax = plt.axes(projection=ccrs.PlateCarree())
+            self.fig.subplots_adjust(left=0.025, right=0.995, bottom=0.01, top=0.99)
+        else:
+            self.fig = ax.figure
+            self.ax = ax
         self.ax.set_extent(extent, crs=ccrs.PlateCarree())
 
-        # OCEAN - slightly darker background for water
         self.ax.set_facecolor(COLORS['ocean'])
+
+        # The Natural Earth layers and grid lines are drawn as vectors once per
+        # figure size and extent, then reused as an image; only the graticule
+        # labels (outside the map) stay vector artists on later figures
+        key = (tuple(self.fig.bbox.size), tuple(self.ax.get_position().bounds), tuple(extent))
+        basemap = self._basemap_cache.get(key)
+        if basemap is not None:
+            self._basemap_cache.move_to_end(key)
+            self.ax.imshow(basemap, extent=extent, origin='upper', transform=ccrs.PlateCarree(),
+                           interpolation='nearest', zorder=0)
+            self._add_graticule(lines=False)
+        else:
+            self._add_basemap_features()
+            self._add_graticule(lines=True)
+            basemap = self._render_map_pixels()
+            if basemap is not None:
+                self._basemap_cache[key] = basemap
+                while len(self._basemap_cache) > BASEMAP_CACHE_SIZE:
+                    self._basemap_cache.popitem(last=False)
+
+        # Remove axis spines
+        self.ax.spines['geo'].set_edgecolor(COLORS['text_secondary'])
+        self.ax.spines['geo'].set_linewidth(0.5)
+
+        return self.fig, self.ax
+
+    @classmethod
+    def clear_basemap_cache(cls):
+        """Drop every cached basemap image (e.g. after the Natural Earth data changed)."""
+        cls._basemap_cache.clear()
+
+    def _add_basemap_features(self):
+        """Add the Natural Earth ocean, land, coastline, lake and river layers."""
+        # OCEAN - slightly darker background for water
         ocean = cfeature.OCEAN
         self.ax.add_feature(ocean, facecolor=COLORS['ocean'], zorder=0)
 
@@ -103,6 +227,14 @@ class OceanDriftVisualizer:
             zorder=2
         )
 
+    def _add_graticule(self, lines: bool = True):
+        """
+        Add the 10-degree graticule with labels.
+
+        Args:
+            lines: Whether to draw the grid lines (False when they are already
+                part of a cached basemap image)
+        """
         # GRATICULES - 10-degree grid for reference
         gl = self.ax.gridlines(
             draw_labels=True,
@@ -125,12 +257,31 @@ class OceanDriftVisualizer:
         import matplotlib.ticker as mticker
         gl.xlocator = mticker.FixedLocator(range(-180, 181, 10))
         gl.ylocator = mticker.FixedLocator(range(-90, 91, 10))
+        gl.xlines = lines
+        gl.ylines = lines
 
-        # Remove axis spines
-        self.ax.spines['geo'].set_edgecolor(COLORS['text_secondary'])
-        self.ax.spines['geo'].set_linewidth(0.5)
+    def _render_map_pixels(self) -> Optional[np.ndarray]:
+        """
+        Draw the figure and copy the map area's RGBA pixels.
 
-        return self.fig, self.ax
+        Returns:
+            (H, W, 4) uint8 array, or None if the canvas has no pixel buffer
+            or the Natural Earth layers could not be downloaded or read
+        """
+        canvas = self.fig.canvas
+        if not hasattr(canvas, 'buffer_rgba'):
+            return None
+
+        try:
+            canvas.draw()
+        except OSError:  # includes urllib's URLError
+            return None
+        pixels = np.asarray(canvas.buffer_rgba())
+        bbox = self.ax.get_window_extent()
+        height = pixels.shape[0]
+        rows = slice(int(round(height - bbox.y1)), int(round(height - bbox.y0)))
+        cols = slice(int(round(bbox.x0)), int(round(bbox.x1)))
+        return pixels[rows, cols].copy()
 
     def plot_gyre_background(self, alpha: float = 0.15):
         """
@@ -151,7 +302,7 @@ class OceanDriftVisualizer:
         # Distance from gyre center
         dlat = lat_grid - gyre_lat
         dlon = lon_grid - gyre_lon
-        r = np.sqrt(dlat**2 + dlon**2)
+        r = np.hypot(dlat, dlon)
 
         # Gaussian density
         density = np.exp(-(r / 20.0)**2)
@@ -261,7 +412,8 @@ class OceanDriftVisualizer:
                     weight='bold', style='italic', alpha=0.7,
                     transform=ccrs.PlateCarree(), zorder=5)
 
-    def add_info_card(self, city: str, probability: str, distance_km: float, step: int, total_steps: int):
+    def add_info_card(self, city: str, probability: str, distance_km: float, step: int,
+                      total_steps: int) -> Dict[str, plt.Text]:
         """
         Add info card overlay.
 
@@ -271,6 +423,9 @@ class OceanDriftVisualizer:
             distance_km: Total trajectory distance
             step: Current step
             total_steps: Total simulation steps
+
+        Returns:
+            Text artists that change between frames, keyed by field
         """
         # Position in figure coordinates
         card_x = 0.75
@@ -278,6 +433,8 @@ class OceanDriftVisualizer:
         card_width = 0.22
         card_height = 0.25
 
+        n_fig_texts = len(self.fig.texts)
+
         # Add background box
         card_bg = mpatches.FancyBboxPatch(
             (card_x, card_y), card_width, card_height,
@@ -301,20 +458,16 @@ class OceanDriftVisualizer:
             fontsize=14, color=COLORS['text'], weight='bold',
             transform=self.fig.transFigure, zorder=101, family='DejaVu Sans'
         )
-        self.fig.text(
+        city_text = self.fig.text(
             text_x + 0.03, text_y_start, city.upper(),
             fontsize=12, color=COLORS['text'], weight='bold',
             transform=self.fig.transFigure, zorder=101
         )
 
         # Probability
-        prob_color = {
-            'LOW': '#4a9eff',
-            'MEDIUM': '#ffaa00',
-            'HIGH': '#ff4444'
-        }.get(probability, COLORS['text'])
+        prob_color = PROBABILITY_COLORS.get(probability, COLORS['text'])
 
-        self.fig.text(
+        prob_text = self.fig.text(
             text_x, text_y_start - 0.06, probability,
             fontsize=20, color=prob_color, weight='bold',
             transform=self.fig.transFigure, zorder=101
@@ -326,7 +479,7 @@ class OceanDriftVisualizer:
         )
 
         # Distance
-        self.fig.text(
+        distance_text = self.fig.text(
             text_x, text_y_start - 0.14, f"{distance_km:,.0f} KM",
             fontsize=16, color=COLORS['trajectory'], weight='bold',
             transform=self.fig.transFigure, zorder=101
@@ -339,12 +492,21 @@ class OceanDriftVisualizer:
 
         # Time counter
         years = step / 52.0
-        self.fig.text(
+        year_text = self.fig.text(
             text_x, text_y_start - 0.22, f"Year {years:.1f} / 20.0",
             fontsize=8, color=COLORS['text'],
             transform=self.fig.transFigure, zorder=101
         )
 
+        self._info_card_artists = [card_bg] + self.fig.texts[n_fig_texts:]
+
+        return {
+            'city': city_text,
+            'probability': prob_text,
+            'distance': distance_text,
+            'year': year_text,
+        }
+
     def add_logo(self):
         """
         Add Ocean Cleanup logo text.
@@ -362,7 +524,7 @@ class OceanDriftVisualizer:
         """
         # 1000 km scale bar
         scale_length_km = 1000
-        scale_length_deg = scale_length_km / 111.32  # degrees
+        scale_length_deg = scale_length_km / DEG_TO_KM  # degrees
 
         # Position
         x_start = -95
@@ -427,12 +589,12 @@ class OceanDriftVisualizer:
         if show_trajectories:
             traj_lat, traj_lon = particle_system.get_trajectory_arrays(subsample=1)
             # Truncate to current step
-            traj_lat_truncated = [t[:step+1] for t in traj_lat]
-            traj_lon_truncated = [t[:step+1] for t in traj_lon]
+            traj_lat_truncated = traj_lat[:, :step+1]
+            traj_lon_truncated = traj_lon[:, :step+1]
             self.plot_trajectories(traj_lat_truncated, traj_lon_truncated, subsample=traj_subsample)
 
         # Add current particles
-        if show_particles and step < len(particle_system.history_lat):
+        if show_particles and step <= particle_system.step_count:
             lat, lon, beached = particle_system.get_positions_at_step(step)
             self.plot_particles(lat, lon, beached)
 
@@ -447,7 +609,7 @@ class OceanDriftVisualizer:
             probability=prob_category,
             distance_km=metrics['median_distance_km'],
             step=step,
-            total_steps=len(particle_system.history_lat) - 1
+            total_steps=particle_system.step_count
         )
 
         # Add logo
@@ -456,11 +618,263 @@ class OceanDriftVisualizer:
         # Add scale bar
         self.add_scale_bar()
 
-        # Adjust layout
-        plt.tight_layout(pad=0.5)
+        return self.fig
+
+    def update_frame(self, particle_system: ParticleSystem, city_name: str, step: int,
+                     show_trajectories: bool = True, show_particles: bool = True,
+                     traj_subsample: int = 10) -> plt.Figure:
+        """
+        Render a frame by updating persistent artists in place.
+
+        The basemap, gyre background and overlays are built on the first call
+        only; later calls just move trajectories and particles and rewrite the
+        info card. Use this instead of render_frame for frame sequences.
+
+        Args:
+            particle_system: ParticleSystem instance
+            city_name: City name for info card
+            step: Current time step
+            show_trajectories: Whether to show full trajectories
+            show_particles: Whether to show current particles
+            traj_subsample: Subsample factor for trajectories
+
+        Returns:
+            Figure
+        """
+        snapshot = snapshot_frame(particle_system, step, show_trajectories=show_trajectories,
+                                  show_particles=show_particles, traj_subsample=traj_subsample)
+        return self.draw_snapshot(snapshot, city_name)
+
+    def draw_snapshot(self, snapshot: Dict, city_name: str, blit: bool = False,
+                      update_trajectories: bool = True) -> plt.Figure:
+        """
+        Render a frame from a snapshot_frame() dict by updating persistent artists.
+
+        Args:
+            snapshot: Frame state captured by snapshot_frame
+            city_name: City name for info card
+            blit: Redraw only the moving artists over a saved copy of the static
+                layers, leaving the canvas pixels up to date on return. Without
+                it the caller is expected to draw the figure.
+            update_trajectories: Replace the trajectory lines with the
+                snapshot's; False keeps the lines already drawn (see
+                set_trajectories)
+
+        Returns:
+            Figure
+        """
+        if self.fig is None or self._frame_artists is None:
+            self._build_frame_artists()
+
+        artists = self._frame_artists
+
+        # Trajectories up to current step
+        if update_trajectories:
+            self.set_trajectories(snapshot['traj_lat'], snapshot['traj_lon'])
+
+        # Current particles
+        empty = np.empty((0, 2), dtype=np.float32)
+        active_xy = snapshot['active_xy'] if snapshot['active_xy'] is not None else empty
+        beached_xy = snapshot['beached_xy'] if snapshot['beached_xy'] is not None else empty
+        artists['active'].set_offsets(active_xy)
+        artists['beached'].set_offsets(beached_xy)
+
+        # Info card
+        prob_category = snapshot['probability']
+        info = artists['info']
+        info['city'].set_text(city_name.upper())
+        info['probability'].set_text(prob_category)
+        info['probability'].set_color(PROBABILITY_COLORS.get(prob_category, COLORS['text']))
+        info['distance'].set_text(f"{snapshot['distance_km']:,.0f} KM")
+        info['year'].set_text(f"Year {snapshot['step'] / 52.0:.1f} / 20.0")
+
+        if blit:
+            if hasattr(self.fig.canvas, 'copy_from_bbox'):
+                self._blit_frame()
+            else:
+                self.fig.canvas.draw()
 
         return self.fig
 
+    def set_trajectories(self, traj_lat: Optional[np.ndarray], traj_lon: Optional[np.ndarray]):
+        """
+        Replace the trajectory lines of the persistent frame.
+
+        Args:
+            traj_lat: (T, k) latitudes, or None to clear the lines
+            traj_lon: (T, k) longitudes
+        """
+        if self.fig is None or self._frame_artists is None:
+            self._build_frame_artists()
+
+        segments = []
+        if traj_lat is not None and len(traj_lat) > 1:
+            segments = np.stack([traj_lon.T, traj_lat.T], axis=-1)
+        self._frame_artists['trajectories'].set_segments(segments)
+
+    def dynamic_artists(self) -> List:
+        """
+        Artists draw_snapshot changes, in drawing order.
+
+        The whole info card is included (not just its changing text) so that
+        when blitting it is still drawn over the particles beneath it.
+        """
+        artists = self._frame_artists
+        return [artists['trajectories'], artists['beached'], artists['active'],
+                *artists['card']]
+
+    def _blit_frame(self):
+        """
+        Restore the static layers and draw only the dynamic artists on top.
+
+        The background is captured on the first call (and again if the figure
+        is resized) by drawing the figure once with the dynamic artists hidden.
+        Only the map and info card region is saved and blitted, so anything
+        else on the figure (such as UI widgets) is left alone. Static artists
+        in that region with a higher z-order than the dynamic ones (labels,
+        scale bar) are left out of the background as well. They are rendered
+        once into small RGBA images that are blended back in z-order with the
+        dynamic artists, so particles pass underneath them without their text
+        being re-rendered every frame.
+        """
+        canvas = self.fig.canvas
+        dynamic = self.dynamic_artists()
+
+        if self._blit_background is None or self._blit_bounds != self.fig.bbox.bounds:
+            for artist in dynamic:
+                artist.set_visible(False)
+            canvas.draw()
+            self._blit_bbox = Bbox.union([self.ax.bbox,
+                                          self._frame_artists['card'][0].get_window_extent()])
+            overlays = self._overlay_artists(dynamic)
+            self._blit_overlays = [self._render_overlay(artist) for artist in overlays]
+            for artist in overlays:
+                artist.set_visible(False)
+            canvas.draw()
+            self._blit_background = canvas.copy_from_bbox(self._blit_bbox)
+            self._blit_bounds = self.fig.bbox.bounds
+            for artist in dynamic + overlays:
+                artist.set_visible(True)
+        else:
+            canvas.restore_region(self._blit_background)
+
+        # Stable sort: equal z-orders keep dynamic_artists' drawing order
+        layers = sorted([(artist.get_zorder(), artist) for artist in dynamic] + self._blit_overlays,
+                        key=lambda layer: layer[0])
+        renderer = canvas.get_renderer()
+        gc = renderer.new_gc()
+        for _, layer in layers:
+            if isinstance(layer, tuple):
+                renderer.draw_image(gc, *layer)
+            else:
+                self.fig.draw_artist(layer)
+        gc.restore()
+        canvas.blit(self._blit_bbox)
+
+    def _overlay_artists(self, dynamic: List) -> List:
+        """
+        Visible static artists drawn above the lowest dynamic artist inside
+        the blit region. Needs a drawn canvas (for text extents).
+
+        Args:
+            dynamic: Artists from dynamic_artists()
+
+        Returns:
+            Artists to leave out of the blit background
+        """
+        floor = min(artist.get_zorder() for artist in dynamic)
+        renderer = self.fig.canvas.get_renderer()
+        candidates = self.ax.get_children() + self.fig.get_children()
+        return [artist for artist in candidates
+                if artist not in dynamic and artist is not self.ax
+                and artist.get_visible() and artist.get_zorder() > floor
+                and artist.get_window_extent(renderer).overlaps(self._blit_bbox)]
+
+    def _render_overlay(self, artist) -> Tuple[float, Tuple[int, int, np.ndarray]]:
+        """
+        Render one static artist on its own, for _blit_frame to blend back.
+
+        Args:
+            artist: Static artist from _overlay_artists
+
+        Returns:
+            (zorder, (x, y, pixels)): the RGBA pixels of the artist's window
+            extent, transparent around it, and their lower-left canvas corner
+        """
+        width, height = (int(round(v)) for v in self.fig.bbox.size)
+        renderer = RendererAgg(width, height, self.fig.dpi)
+        artist.draw(renderer)
+
+        # Padded for antialiasing and clipped to the blit region
+        extent = Bbox.intersection(artist.get_window_extent(renderer).padded(2),
+                                   self._blit_bbox)
+        x0, y0 = int(extent.x0), int(extent.y0)
+        x1, y1 = int(np.ceil(extent.x1)), int(np.ceil(extent.y1))
+        pixels = np.asarray(renderer.buffer_rgba())[height - y1:height - y0, x0:x1].copy()
+        return artist.get_zorder(), (x0, y0, pixels[::-1])
+
+    def attach(self, ax):
+        """
+        Build the frame on an existing PlateCarree GeoAxes instead of a new
+        figure; draw_snapshot then updates it in place.
+
+        Args:
+            ax: Map axes to draw into (e.g. the interactive UI's map panel)
+        """
+        self._build_frame_artists(ax)
+        self._blit_background = None
+        self._blit_overlays = []
+
+    def _build_frame_artists(self, ax=None):
+        """
+        Draw the static layers once and create the artists update_frame mutates.
+
+        Args:
+            ax: Existing map axes to draw into (see setup_figure)
+        """
+        self.setup_figure(ax=ax)
+        self.plot_gyre_background()
+
+        trajectories = LineCollection(
+            [],
+            colors=COLORS['trajectory'],
+            alpha=0.03,
+            linewidths=0.5,
+            transform=ccrs.PlateCarree(),
+            zorder=3
+        )
+        self.ax.add_collection(trajectories, autolim=False)
+
+        active = self.ax.scatter(
+            [], [],
+            s=1.5,
+            color=COLORS['trajectory'],
+            alpha=0.8,
+            transform=ccrs.PlateCarree(),
+            zorder=4
+        )
+        beached = self.ax.scatter(
+            [], [],
+            s=0.5,
+            color=COLORS['gyre'],
+            alpha=0.3,
+            transform=ccrs.PlateCarree(),
+            zorder=3.5
+        )
+
+        self.add_labels()
+        info = self.add_info_card(city='', probability='', distance_km=0.0, step=0, total_steps=0)
+        self.add_logo()
+        self.add_scale_bar()
+
+        self._frame_artists = {
+            'trajectories': trajectories,
+            'active': active,
+            'beached': beached,
+            'info': info,
+            'card': self._info_card_artists,
+        }
+
     def save_frame(self, filename: str):
         """
         Save current frame.
@@ -473,9 +887,7 @@ class OceanDriftVisualizer:
                 filename,
                 dpi=self.dpi,
                 facecolor=COLORS['background'],
-                edgecolor='none',
-                bbox_inches='tight',
-                pad_inches=0.1
+                edgecolor='none'
             )
 
     def close(self):
@@ -486,3 +898,7 @@ class OceanDriftVisualizer:
             plt.close(self.fig)
             self.fig = None
             self.ax = None
+            self._frame_artists = None
+            self._blit_background = None
+            self._blit_bbox = None
+            self._blit_bounds = None